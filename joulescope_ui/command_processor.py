@@ -123,6 +123,7 @@ class CommandProcessor(QtCore.QObject):
 
         self._topic = {}
         self._subscribers = {}
+        self._subscriber_wildcards = {}  # topic -> tuple of matching wildcard topics
         self._undos = []  # tuples of (do, undo), do is tuple (command, data), undo is list of tuples (command, data)
         self._redos = []  # tuples of (do, undo), do is tuple (command, data), undo is list of tuples (command, data)
         self._thread_id = None
@@ -235,9 +236,10 @@ class CommandProcessor(QtCore.QObject):
             redo_undos = None
             if _is_command(topic):
                 log.debug('cmd %s | %s', topic, data)
-                if bool(self._topic[topic].get('record_undo', False)) and len(self._topic_stack) == 1:
+                entry = self._topic[topic]
+                if entry['record_undo'] and len(self._topic_stack) == 1:
                     self._stack_undo = []
-                execute_fn = self._topic[topic]['execute_fn']()
+                execute_fn = entry['execute_fn']()
                 if execute_fn is not None:
                     rv = execute_fn(topic, data)
                     if rv is not None and rv[0] is not None:
@@ -306,9 +308,10 @@ class CommandProcessor(QtCore.QObject):
         :param force_signal: Force signal, even if within command stack
         """
         if _is_command(topic):
-            if topic not in self._topic:
+            entry = self._topic.get(topic)
+            if entry is None:
                 raise KeyError(f'unknown command {topic}')
-            fn = self._topic[topic]['validate_fn']
+            fn = entry['validate_fn']
             if fn is not None:
                 fn = fn()  # dereference weakref
             if fn is not None and callable(fn):
@@ -323,8 +326,9 @@ class CommandProcessor(QtCore.QObject):
     def subscribe(self, topic, update_fn, update_now=False):
         """Subscribe to a topic.
 
-        :param topic: The topic name.  Topic names that end with "/"
-            are wildcards that match all subtopics.
+        :param topic: The topic name or a list of topic names.
+            Topic names that end with "/" are wildcards that match all
+            subtopics.
         :param update_fn: The callable(topic, data) that will be called
             whenever topic is published.  The return value is ignored.
             Note that this instance stores a weakref to update_fn so that
@@ -341,10 +345,16 @@ class CommandProcessor(QtCore.QObject):
         """
         if _is_lambda_or_local(update_fn):
             raise ValueError(f'Provided update_fn {update_fn.__qualname__} that may have limited lifetime')
-        subscribers = self._subscribers.get(topic, [])
         update_fn = _weakref_factory(update_fn)
-        subscribers.append(update_fn)
-        self._subscribers[topic] = subscribers
+        if isinstance(topic, (list, tuple)):
+            # share a single weakref across all topics
+            for t in topic:
+                self._subscribe(t, update_fn, update_now)
+        else:
+            self._subscribe(topic, update_fn, update_now)
+
+    def _subscribe(self, topic, update_fn, update_now):
+        self._subscribers.setdefault(topic, []).append(update_fn)
         if bool(update_now):
             if _is_command(topic):
                 log.warning('commands do not support update_now')
@@ -362,12 +372,19 @@ class CommandProcessor(QtCore.QObject):
     def unsubscribe(self, topic, update_fn):
         """Unsubscribe from a topic.
 
-        :param topic: The topic name provided to :meth:`subscribe`.
+        :param topic: The topic name or list of topic names
+            provided to :meth:`subscribe`.
         :param update_fn: The callable provided to :meth:`subscribe`.
         """
-        subscribers = self._subscribers.get(topic, [])
         if isinstance(update_fn, _weakref_type):
             update_fn = update_fn()
+        if isinstance(topic, (list, tuple)):
+            rv = [self._unsubscribe(t, update_fn) for t in topic]
+            return all(rv)
+        return self._unsubscribe(topic, update_fn)
+
+    def _unsubscribe(self, topic, update_fn):
+        subscribers = self._subscribers.get(topic, [])
         if update_fn is not None:
             for subscriber in subscribers:
                 if subscriber() == update_fn:
@@ -387,24 +404,39 @@ class CommandProcessor(QtCore.QObject):
         return True
 
     def _subscribers_call(self, subscribers, topic, value):
-        remove_indices = []
+        remove_indices = None  # only allocate when a subscriber expired
         for idx, subscriber in enumerate(subscribers):
             if not self._subscriber_call(subscriber, topic, value):
+                if remove_indices is None:
+                    remove_indices = []
                 remove_indices.append(idx)
-        for idx in remove_indices[-1::-1]:
-            log.debug('removing expired subscriber from %s', topic)
-            subscribers.pop(idx)
+        if remove_indices is not None:
+            for idx in reversed(remove_indices):
+                log.debug('removing expired subscriber from %s', topic)
+                subscribers.pop(idx)
+
+    def _wildcards_get(self, topic):
+        wildcards = self._subscriber_wildcards.get(topic)
+        if wildcards is None:
+            wildcards = []
+            subscriber_parts = topic.split('/')
+            while len(subscriber_parts):
+                subscriber_parts[-1] = ''
+                wildcards.append('/'.join(subscriber_parts))
+                subscriber_parts.pop()
+            wildcards = tuple(wildcards)
+            self._subscriber_wildcards[topic] = wildcards
+        return wildcards
 
     def _subscriber_update(self, topic, value):
-        subscribers = self._subscribers.get(topic, [])
-        self._subscribers_call(subscribers, topic, value)
-        subscriber_parts = topic.split('/')
-        while len(subscriber_parts):
-            subscriber_parts[-1] = ''
-            n = '/'.join(subscriber_parts)
-            subscribers = self._subscribers.get(n, [])
+        subscribers_map = self._subscribers
+        subscribers = subscribers_map.get(topic)
+        if subscribers:
             self._subscribers_call(subscribers, topic, value)
-            subscriber_parts.pop()
+        for n in self._wildcards_get(topic):
+            subscribers = subscribers_map.get(n)
+            if subscribers:
+                self._subscribers_call(subscribers, topic, value)
 
     def _preferences_bulk_update(self, profile_name=None, flat_old=None):
         if flat_old is None:
@@ -23,11 +23,17 @@ Much inspiration for this module was drawn from the excellent
 from PySide2 import QtWidgets, QtGui, QtCore
 import os
 import numpy as np
-from .ui_util import clear_layout
+from .ui_util import clear_layout, signals_blocked
 import logging
 log = logging.getLogger(__name__)
 
 
+def _style_sheet_set(widget, style_sheet):
+    """Set a widget style sheet, skipping the restyle when unchanged."""
+    if widget.styleSheet() != style_sheet:
+        widget.setStyleSheet(style_sheet)
+
+
 class Parameter(object):
     """The base class for a parameter value with validation and GUI bindings.
 
@@ -303,6 +309,7 @@ class Int(Parameter):
         else:
             self.spinedit = QtWidgets.QSpinBox(self.widget)
             self.spinedit.setRange(*self.vrange)
+            self.spinedit.setStepType(QtWidgets.QAbstractSpinBox.AdaptiveDecimalStepType)
             self.spinedit.setValue(self.value)
             self.spinedit.valueChanged.connect(self.update)
             self.add_widget(self.spinedit)
@@ -318,11 +325,11 @@ class Int(Parameter):
 
     def on_valid(self):
         if self.textedit is not None:
-            self.textedit.setStyleSheet("")
+            _style_sheet_set(self.textedit, "")
 
     def on_invalid(self):
         if self.textedit is not None:
-            self.textedit.setStyleSheet("QLineEdit{background:red;}")
+            _style_sheet_set(self.textedit, "QLineEdit{background:red;}")
 
     def validate(self, x):
         x = int(x)
@@ -410,10 +417,10 @@ class Float(Parameter):
                 if x < self.vrange[0] or x > self.vrange[1]:
                     raise ValueError('Out of range')
             if self.textedit is not None:
-                self.textedit.setStyleSheet("")
+                _style_sheet_set(self.textedit, "")
         except Exception:
             if self.textedit is not None:
-                self.textedit.setStyleSheet("QLineEdit{background:red;}")
+                _style_sheet_set(self.textedit, "QLineEdit{background:red;}")
             raise
         return x
 
@@ -440,6 +447,14 @@ class Float(Parameter):
                 self.slider.setValue(v_pos)
 
 
+def _index_map(values):
+    """Map each value to the index of its first occurrence."""
+    index = {}
+    for idx, v in enumerate(values):
+        index.setdefault(v, idx)
+    return index
+
+
 class Enum(Parameter):
     """An enumerated valued item.
 
@@ -453,6 +468,7 @@ class Enum(Parameter):
     def __init__(self, name: str, value=None, values=None, tooltip: str='', closed=True):
         if values is not None:
             self._values = [str(v) for v in values]
+            self._values_index = _index_map(self._values)
         if value is None and self._values:
             value = self._values[0]
         self._closed = closed
@@ -469,23 +485,21 @@ class Enum(Parameter):
     def _update_values(self):
         if self.comboBox is None:
             return
-        block_signals_state = self.comboBox.blockSignals(True)
-        self.comboBox.clear()
-        if self._values:
-            for v in self._values:
-                self.comboBox.addItem(v)
-            self.comboBox.setEnabled(True)
-        elif self._closed:
-            self.comboBox.setEnabled(False)
-        else:
-            self.comboBox.setEnabled(True)
-        if self._value is not None:
-            idx = self.comboBox.findText(str(self._value))
-            if idx >= 0:
-                self.comboBox.setCurrentIndex(idx)
-            elif not self._closed:
-                self.comboBox.setEditText(str(self._value))
-        self.comboBox.blockSignals(block_signals_state)
+        with signals_blocked(self.comboBox):
+            self.comboBox.clear()
+            if self._values:
+                self.comboBox.addItems(self._values)
+                self.comboBox.setEnabled(True)
+            elif self._closed:
+                self.comboBox.setEnabled(False)
+            else:
+                self.comboBox.setEnabled(True)
+            if self._value is not None:
+                idx = self._values_index.get(str(self._value), -1)
+                if idx >= 0:
+                    self.comboBox.setCurrentIndex(idx)
+                elif not self._closed:
+                    self.comboBox.setEditText(str(self._value))
         self.comboBox.currentIndexChanged.connect(self._on_index_changed)
         self.comboBox.editTextChanged.connect(self._on_text_changed)
 
@@ -499,6 +513,7 @@ class Enum(Parameter):
     @values.setter
     def values(self, values):
         self._values = [str(v) for v in values]
+        self._values_index = _index_map(self._values)
         self._update_values()
         if self._values and self._closed:
             if self._value not in self._values:
@@ -508,20 +523,19 @@ class Enum(Parameter):
         if x is None:
             return None
         x = str(x)
-        if self._closed:  # require to be in values
-            self._values.index(x)
+        if self._closed and x not in self._values_index:  # require to be in values
+            raise ValueError(f'{x!r} is not in values')
         return x
 
     def on_changed(self):
         v = self.value
         if self.comboBox is not None and v is not None:
             if v != str(self.comboBox.currentText()):
-                try:
-                    idx = self._values.index(v)
+                idx = self._values_index.get(v)
+                if idx is not None:
                     self.comboBox.setCurrentIndex(idx)
-                except (TypeError, AttributeError, ValueError):
-                    if not self._closed:
-                        self.comboBox.setEditText(v)
+                elif not self._closed:
+                    self.comboBox.setEditText(v)
 
     def _on_text_changed(self, txt):
         txt = str(txt)
@@ -529,11 +543,11 @@ class Enum(Parameter):
 
     def on_valid(self):
         if self.comboBox is not None:
-            self.comboBox.setStyleSheet("")
+            _style_sheet_set(self.comboBox, "")
 
     def on_invalid(self):
         if self.comboBox is not None:
-            self.comboBox.setStyleSheet("QComboBox{background:red;}")
+            _style_sheet_set(self.comboBox, "QComboBox{background:red;}")
 
 
 class String(Parameter):
@@ -557,11 +571,11 @@ class String(Parameter):
 
     def on_valid(self):
         if self.lineEdit is not None:
-            self.lineEdit.setStyleSheet("")
+            _style_sheet_set(self.lineEdit, "")
 
     def on_invalid(self):
         if self.lineEdit is not None:
-            self.lineEdit.setStyleSheet("QLineEdit{background:red;}")
+            _style_sheet_set(self.lineEdit, "QLineEdit{background:red;}")
 
     def _on_text_changed(self, value):
         try:
@@ -622,6 +636,16 @@ PTYPE_MAP = {
     'save': (PTYPE_SAVE, ":/record.png"),
     'dir':  (PTYPE_DIR,  ":/pause.png"),
 }
+_PTYPE_ICONS = {}  # ptype -> QIcon, populated on first use (needs QApplication)
+
+
+def _ptype_icon(ptype):
+    icon = _PTYPE_ICONS.get(ptype)
+    if icon is None:
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(PTYPE_MAP[ptype][1]), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        _PTYPE_ICONS[ptype] = icon
+    return icon
 
 
 def ptype_lookup(ptype):
@@ -653,10 +677,7 @@ class Path(String):
         String.populate_subclass(self, parent)
         self.path_button = QtWidgets.QPushButton(self.widget)
         self.path_button.clicked.connect(self._on_path_change)
-        icon1 = QtGui.QIcon()
-        icon_path = PTYPE_MAP[self.ptype][1]
-        icon1.addPixmap(QtGui.QPixmap(icon_path), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.path_button.setIcon(icon1)
+        self.path_button.setIcon(_ptype_icon(self.ptype))
         self.path_button.setFlat(True)
         self.path_button.setObjectName("pathButton")
         self.path_button.setStyleSheet('QPushButton:flat {   border: none; }')
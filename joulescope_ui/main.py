@@ -44,7 +44,6 @@ from joulescope_ui.preferences_defaults import defaults as preference_defaults
 from joulescope_ui import ui_util
 from joulescope_ui.themes.manager import theme_loader, theme_update
 from queue import Queue, Empty
-import copy
 import io
 import ctypes
 import collections
@@ -64,6 +63,10 @@ STATUS_BAR_TIMEOUT = 5000  # milliseconds
 USERS_GUIDE_URL = "https://download.joulescope.com/docs/JoulescopeUsersGuide/index.html"
 FRAME_LIMIT_DELAY_MS = 30
 FRAME_LIMIT_MAXIMUM_DELAY_MS = 2000
+WINDOW_STATE_UPDATE_DELAY_MS = 16  # coalesce resize and move events
+CURRENT_RANGING_TOPIC = 'Device/Current Ranging/'
+CURRENT_RANGING_TOPIC_LEN = len(CURRENT_RANGING_TOPIC)
+DEVICE_PARAMETER_TOPICS = ('Device/setting/', 'Device/extio/')
 _excepthook = sys.excepthook
 _unraisablehook = getattr(sys, 'unraisablehook', lambda *args: None)
 
@@ -147,6 +150,21 @@ Connect a Joulescope or
 open a file."""
 
 
+DEVICE_ON_CLOSE_PARAMETER = {  # Device/on_close value -> (parameter, value)
+    'sensor_off': ('sensor_power', 'off'),
+    'current_off': ('i_range', 'off'),
+    'current_auto': ('i_range', 'auto'),
+    # keep: no parameter change
+}
+
+DEVICE_CLOSE_STATE = (  # (topic, value) published when the device closes
+    ('Device/#state/name', ''),
+    ('Device/#state/source', 'None'),
+    ('Device/#state/stream', 'inactive'),
+    ('Device/#state/play', False),
+    ('Device/#state/record', False),
+)
+
 WINDOW_STATE_MAP = {
     "normal": QtCore.Qt.WindowNoState,
     "minimized": QtCore.Qt.WindowMinimized,
@@ -179,6 +197,21 @@ def dict_update_recursive(tgt, src):
             tgt[key] = value
 
 
+def accumulators_copy(accumulators):
+    """Copy the accumulators state.
+
+    :param accumulators: The accumulators dict with "time" and "fields".
+    :return: The copied accumulators dict.
+
+    The structure is fixed and only contains floats, so this is much
+    less expensive than copy.deepcopy().
+    """
+    return {
+        'time': accumulators['time'],
+        'fields': {k: list(v) for k, v in accumulators['fields'].items()},
+    }
+
+
 class DeviceDisable:
 
     def __str__(self):
@@ -241,7 +274,7 @@ class MyDockWidget(QtWidgets.QDockWidget):
         self._parent._window_state_update()
 
     def resizeEvent(self, event):
-        self._parent._window_state_update()
+        self._parent._window_state_update_request()
 
     def dock_widget_close(self):
         if not self.widget_def.get('singleton', False):
@@ -285,6 +318,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self._fps_limit_timer = QtCore.QTimer()
         self._fps_limit_timer.setSingleShot(True)
         self._fps_limit_timer.timeout.connect(self.on_fpsTimer)
+        self._window_state_timer = QtCore.QTimer()
+        self._window_state_timer.setSingleShot(True)
+        self._window_state_timer.setInterval(WINDOW_STATE_UPDATE_DELAY_MS)
+        self._window_state_timer.timeout.connect(self._window_state_update)
         self._range_tool = None  # the current running range tools
         self._range_tools = []   # completed range tools with open windows
 
@@ -296,6 +333,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._profile_action_group = None
 
         self._parameters = {}
+        self._device_parameter_names = {}  # topic -> device parameter name
         self._data_view = None  # created when device is opened
         self._recording = None  # created to record stream to JLS file
         self._statistics_recording = None  # record statistics to CSV file
@@ -609,10 +647,9 @@ class MainWindow(QtWidgets.QMainWindow):
             # process resync_handler resync calls.
             event.accept()
             try:
-                name, args, kwargs, ev = self._resync_queue.get(timeout=0.0)
+                fn, args, kwargs, ev = self._resync_queue.get(timeout=0.0)
                 if id(event) != id(ev):
                     log.warning('event mismatch')
-                fn = getattr(self, f'_on_{name}')
                 fn(*args, **kwargs)
             except Empty:
                 log.warning('event signaled but not available')
@@ -622,10 +659,10 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             return super(MainWindow, self).event(event)
 
-    def _resync_handle(self, name, args, kwargs):
+    def _resync_handle(self, target, args, kwargs):
         # safely resynchronize to the main Qt event thread
         event = QResyncEvent()
-        self._resync_queue.put((name, args, kwargs, event))
+        self._resync_queue.put((target, args, kwargs, event))
         QtCore.QCoreApplication.postEvent(self, event)
 
     def resync_handler(self, name):
@@ -638,12 +675,14 @@ class MainWindow(QtWidgets.QMainWindow):
             complete immediately, but the actual processing is deferred
             to the main thread's QT event loop.
         """
-        def fn(*args, **kwargs):
-            return self._resync_handle(name, args, kwargs)
         if name not in self._resync_handlers:
-            self._resync_handlers[name] = fn
-            if not hasattr(self, f'_on_{name}'):
+            target = getattr(self, f'_on_{name}', None)
+            if target is None:
                 raise ValueError(f'resync {name} not supported')
+
+            def fn(*args, **kwargs):
+                return self._resync_handle(target, args, kwargs)
+            self._resync_handlers[name] = fn
         return self._resync_handlers[name]
 
     @QtCore.Slot()
@@ -675,13 +714,17 @@ class MainWindow(QtWidgets.QMainWindow):
             self._fps_limit_timer.start(FRAME_LIMIT_MAXIMUM_DELAY_MS)
 
     def _on_device_statistic(self, statistics):
-        self._accumulators['time'] += statistics['time']['delta']['value']
+        accumulators = self._accumulators
+        statistics_time = statistics['time']
+        accumulators['time'] += statistics_time['delta']['value']
         self._record_statistics_item(statistics)
-        statistics['time']['accumulator'] = {'value': self._accumulators['time'], 'units': 's'}
-        for field in ['charge', 'energy']:
-            d = statistics['accumulators'][field]
+        statistics_time['accumulator'] = {'value': accumulators['time'], 'units': 's'}
+        fields = accumulators['fields']
+        statistics_accumulators = statistics['accumulators']
+        for field in ('charge', 'energy'):
+            d = statistics_accumulators[field]
             x = d['value']
-            z = self._accumulators['fields'][field]
+            z = fields[field]
             z[0] += x - z[1]
             z[1] = x
             d['value'] = z[0]
@@ -697,18 +740,15 @@ class MainWindow(QtWidgets.QMainWindow):
             c = statistics['accumulators']['charge']['value']
             e = statistics['accumulators']['energy']['value']
 
-            if self._statistics_recording['offsets'] is None:
-                self._statistics_recording['offsets'] = {
-                    'time': t,
-                    'charge': c,
-                    'energy': e,
-                }
-                self._statistics_recording['file'].write(hdr)
-            t -= self._statistics_recording['offsets']['time']
-            c -= self._statistics_recording['offsets']['charge']
-            e -= self._statistics_recording['offsets']['energy']
-            line = '%.1f,%g,%g,%g,%g,%g\n' % (t, i, v, p, c, e)
-            self._statistics_recording['file'].write(line)
+            recording = self._statistics_recording
+            offsets = recording['offsets']
+            if offsets is None:
+                offsets = (t, c, e)  # time, charge, energy
+                recording['offsets'] = offsets
+                recording['file'].write(hdr)
+            t_offset, c_offset, e_offset = offsets
+            line = '%.1f,%g,%g,%g,%g,%g\n' % (t - t_offset, i, v, p, c - c_offset, e - e_offset)
+            recording['file'].write(line)
 
     def _on_dataview_service_x_change_request(self, topic, value):
         # DataView/#service/x_change_request
@@ -773,13 +813,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _accumulators_reset(self, topic, value):
         log.info('_accumulators_reset')
-        accumulators = copy.deepcopy(self._accumulators)
+        accumulators = accumulators_copy(self._accumulators)
         if value in ['disable', None, True, False]:
             self._accumulators['time'] = 0.0
             for z in self._accumulators['fields'].values():
                 z[0] = 0.0  # accumulated value
         else:
-            self._accumulators = copy.deepcopy(value)
+            self._accumulators = accumulators_copy(value)
         return (topic, value), [(topic, accumulators)]
 
     def _on_accumulators_clear(self, value=None):
@@ -792,9 +832,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _device_state_source(self, topic, data):
         self._source_indicator.setText(f'  {data}  ')
-        self._source_indicator.setToolTip(self._cmdp['Device/#state/name'])
+        tooltip = self._cmdp['Device/#state/name']
+        if self._source_indicator.toolTip() != tooltip:
+            self._source_indicator.setToolTip(tooltip)
 
     def _device_state_stream(self, topic, data):
+        if self._source_indicator.property('stream') == data:
+            return  # Device/#state topics publish even when unchanged
         self._source_indicator.setProperty('stream', data)
         self._source_indicator.style().unpolish(self._source_indicator)
         self._source_indicator.style().polish(self._source_indicator)
@@ -825,7 +869,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._device_state_clear()
         self._data_path_used_set(os.path.dirname(filename))
         pnames = ['type', 'samples_pre', 'samples_window', 'samples_post']
-        values = [str(self._cmdp['Device/Current Ranging/' + p]) for p in pnames]
+        values = [str(self._cmdp[CURRENT_RANGING_TOPIC + p]) for p in pnames]
         current_ranging_format = '_'.join(values)
         filename_parts = filename.split('.')
         if len(filename_parts) > 2:
@@ -879,9 +923,8 @@ class MainWindow(QtWidgets.QMainWindow):
                     self._device.statistics_callback = self.resync_handler('device_statistic')
                 # must apply i_range first to prevent Joulescope OUT glitch
                 self._on_device_parameter('Device/setting/i_range', self._cmdp['Device/setting/i_range'])
-                self._cmdp.subscribe('Device/setting/', self._on_device_parameter, update_now=True)
-                self._cmdp.subscribe('Device/extio/', self._on_device_parameter, update_now=True)
-                self._cmdp.subscribe('Device/Current Ranging/', self._on_device_current_range_parameter, update_now=True)
+                self._cmdp.subscribe(DEVICE_PARAMETER_TOPICS, self._on_device_parameter, update_now=True)
+                self._cmdp.subscribe(CURRENT_RANGING_TOPIC, self._on_device_current_range_parameter, update_now=True)
                 if self._is_streaming_device:
                     self._cmdp.publish('Device/#state/filename', '')
                     if self._cmdp['Device/autostream']:
@@ -905,12 +948,19 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_data_view_update(self, data):
         self._cmdp.publish('DataView/#data', data)
 
+    def _device_parameter_name(self, topic):
+        name = self._device_parameter_names.get(topic)
+        if name is None:
+            name = topic.split('/')[-1]
+            while name.startswith('_'):
+                name = name[1:]
+            self._device_parameter_names[topic] = name
+        return name
+
     def _on_device_parameter(self, topic, value):
         if not hasattr(self._device, 'parameter_set'):
             return
-        topic = topic.split('/')[-1]
-        while topic.startswith('_'):
-            topic = topic[1:]
+        topic = self._device_parameter_name(topic)
         try:
             # print(f'_on_device_parameter({topic}, {value})')
             self._device.parameter_set(topic, value)
@@ -922,7 +972,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_device_current_range_parameter(self, topic, value):
         if not hasattr(self._device, 'parameter_set'):
             return
-        name = 'current_ranging_' + topic.split('/')[-1]
+        name = 'current_ranging_' + topic[CURRENT_RANGING_TOPIC_LEN:]
         try:
             self._device.parameter_set(name, value)
         except Exception:
@@ -931,8 +981,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _device_close(self):
         log.debug('_device_close: start')
-        self._cmdp.unsubscribe('Device/setting/', self._on_device_parameter)
-        self._cmdp.unsubscribe('Device/extio/', self._on_device_parameter)
+        self._cmdp.unsubscribe(DEVICE_PARAMETER_TOPICS, self._on_device_parameter)
         device = self._device
         is_active_device = self._has_active_device
         self._device = self._device_disable
@@ -943,15 +992,9 @@ class MainWindow(QtWidgets.QMainWindow):
         if device:
             on_close = self._cmdp['Device/on_close']
             try:
-                if hasattr(device, 'status'):
-                    if on_close == 'sensor_off':
-                        device.parameter_set('sensor_power', 'off')
-                    elif on_close == 'current_off':
-                        device.parameter_set('i_range', 'off')
-                    elif on_close == 'current_auto':
-                        device.parameter_set('i_range', 'auto')
-                    else:  # keep
-                        pass
+                parameter = DEVICE_ON_CLOSE_PARAMETER.get(on_close)
+                if parameter is not None and hasattr(device, 'status'):
+                    device.parameter_set(*parameter)
             except Exception:
                 log.warning('could not set Device.on_close behavior %s', on_close)
             device.close()
@@ -963,11 +1006,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._device_disable.ui_action.setChecked(True)
         self._streaming_status = None
-        self._cmdp.publish('Device/#state/name', '')
-        self._cmdp.publish('Device/#state/source', 'None')
-        self._cmdp.publish('Device/#state/stream', 'inactive')
-        self._cmdp.publish('Device/#state/play', False)
-        self._cmdp.publish('Device/#state/record', False)
+        for topic, value in DEVICE_CLOSE_STATE:
+            self._cmdp.publish(topic, value)
         gc.collect()  # safe time to force garbage collection
         gc.collect()
         log.debug('_device_close: done')
@@ -1344,15 +1384,13 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._device_can_record():
             self._cmdp.publish('Device/#state/record_statistics', checked)
         else:
-            block_signals_state = self._menu_record_statistics.blockSignals(True)
-            self._menu_record_statistics.setChecked(False)
-            self._menu_record_statistics.blockSignals(block_signals_state)
+            with ui_util.signals_blocked(self._menu_record_statistics):
+                self._menu_record_statistics.setChecked(False)
 
     def _on_device_state_record_statistics(self, topic, enable):
         enable = bool(enable)
-        block_signals_state = self._menu_record_statistics.blockSignals(True)
-        self._menu_record_statistics.setChecked(enable)
-        self._menu_record_statistics.blockSignals(block_signals_state)
+        with ui_util.signals_blocked(self._menu_record_statistics):
+            self._menu_record_statistics.setChecked(enable)
         if enable:
             if self._device_can_record():
                 self._record_statistics_stop()
@@ -1492,9 +1530,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 dock_widget = widget_def['dock_widget']
             action = widget_def.get('action')
             if action is not None:
-                signal_block_state = action.blockSignals(True)
-                action.setChecked(True)
-                action.blockSignals(signal_block_state)
+                with ui_util.signals_blocked(action):
+                    action.setChecked(True)
         else:
             log.info('add widget %s', name)
             dock_widget = MyDockWidget(self, widget_def, self._cmdp, instance_id)
@@ -1528,9 +1565,8 @@ class MainWindow(QtWidgets.QMainWindow):
             log.info('remove singleton widget %s', str(dock_widget))
             action = widget_def.get('action')
             if action is not None:
-                signal_block_state = action.blockSignals(True)
-                action.setChecked(False)
-                action.blockSignals(signal_block_state)
+                with ui_util.signals_blocked(action):
+                    action.setChecked(False)
         else:
             log.info('remove widget %s', name)
             p = dock_widget.state_preference
@@ -1560,7 +1596,12 @@ class MainWindow(QtWidgets.QMainWindow):
             'size': list(self.size().toTuple()),
         }
 
+    def _window_state_update_request(self):
+        self._window_state_timer.start()  # restarts when already pending
+
+    @QtCore.Slot()
     def _window_state_update(self):
+        self._window_state_timer.stop()
         if threading.current_thread().getName() != 'MainThread':
             raise RuntimeError('invalid thread')
         s = self._window_state()
@@ -1583,15 +1624,21 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.restoreGeometry(window_state['geometry'])
                 self.restoreState(window_state['state'])
 
-            # force visible, since restoreState can hide
-            for widget in self._widgets:
-                widget.setVisible(True)
-
-            # force invisible, since restoreState can show
-            active_widgets = self._widgets_active
-            for widget in self.findChildren(QtWidgets.QDockWidget):
-                if str(widget) not in active_widgets:
-                    widget.setVisible(False)
+            # batch the dock visibility changes into a single repaint
+            updates_enabled = self.updatesEnabled()
+            self.setUpdatesEnabled(False)
+            try:
+                # force visible, since restoreState can hide
+                for widget in self._widgets:
+                    widget.setVisible(True)
+
+                # force invisible, since restoreState can show
+                active_widgets = self._widgets_active
+                for widget in self.findChildren(QtWidgets.QDockWidget):
+                    if str(widget) not in active_widgets:
+                        widget.setVisible(False)
+            finally:
+                self.setUpdatesEnabled(updates_enabled)
 
             window_location = self._cmdp['General/window_location']
             window_size = self._cmdp['General/window_size']
@@ -1634,6 +1681,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def closeEvent(self, event):
         log.info('closeEvent()')
+        if self._window_state_timer.isActive():
+            self._window_state_update()
         try:
             self._cmdp.preferences.save()
         except Exception:
@@ -1819,12 +1868,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def resizeEvent(self, event):
         rv = super().resizeEvent(event)
-        self._window_state_update()
+        self._window_state_update_request()
         return rv
 
     def moveEvent(self, event):
         rv = super().moveEvent(event)
-        self._window_state_update()
+        self._window_state_update_request()
         return rv
 
 
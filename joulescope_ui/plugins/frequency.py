@@ -16,6 +16,7 @@ import logging
 import numpy as np
 import pyqtgraph as pg
 from PySide2 import QtCore, QtWidgets
+from . import plugin_helpers
 
 
 log = logging.getLogger(__name__)
@@ -34,7 +35,8 @@ _WINDOWS = {
     'rectangular': np.ones
 }
 
-_FFT_LENGTHS = [64, 128, 256, 512, 1024, 2048, 4096, 8192]
+_FFT_LENGTH_NAMES = [str(2**pow2) for pow2 in range(6, 22)]
+_WINDOW_NAMES = list(_WINDOWS.keys())
 
 
 class Frequency:
@@ -168,9 +170,7 @@ class FrequencyDialog(QtWidgets.QDialog):
 
         self.signalComboBox = QtWidgets.QComboBox(self)
         self.signalComboBox.setObjectName("signalComboBox")
-        self.signalComboBox.addItem("current")
-        self.signalComboBox.addItem("voltage")
-        self.signalComboBox.addItem("power")
+        self.signalComboBox.addItems(plugin_helpers.SIGNAL_NAMES)
         self._layout.addWidget(self.signalComboBox, 0, 1, 1, 1)
 
         self._windowLabel = QtWidgets.QLabel(self)
@@ -179,8 +179,7 @@ class FrequencyDialog(QtWidgets.QDialog):
 
         self._windowComboBox = QtWidgets.QComboBox(self)
         self._windowComboBox.setObjectName("windowComboBox")
-        for key in _WINDOWS.keys():
-            self._windowComboBox.addItem(key)
+        self._windowComboBox.addItems(_WINDOW_NAMES)
         self._windowComboBox.setCurrentIndex(2)  # hamming
         self._layout.addWidget(self._windowComboBox, 1, 1, 1, 1)
 
@@ -190,8 +189,7 @@ class FrequencyDialog(QtWidgets.QDialog):
 
         self._fftLengthComboBox = QtWidgets.QComboBox(self)
         self._fftLengthComboBox.setObjectName('fftLengthComboBox')
-        for pow2 in range(6, 22):
-            self._fftLengthComboBox.addItem(str(2**pow2))
+        self._fftLengthComboBox.addItems(_FFT_LENGTH_NAMES)
         self._fftLengthComboBox.setCurrentIndex(6)
         self._layout.addWidget(self._fftLengthComboBox, 2, 1, 1, 1)
 
@@ -210,8 +208,8 @@ class FrequencyDialog(QtWidgets.QDialog):
         self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel | QtWidgets.QDialogButtonBox.Ok)
         self.buttonBox.setObjectName("buttonBox")
         self.verticalLayout.addWidget(self.buttonBox)
-        QtCore.QObject.connect(self.buttonBox, QtCore.SIGNAL("accepted()"), self.accept)
-        QtCore.QObject.connect(self.buttonBox, QtCore.SIGNAL("rejected()"), self.reject)
+        self.buttonBox.accepted.connect(self.accept)
+        self.buttonBox.rejected.connect(self.reject)
 
     def exec_(self):
         if QtWidgets.QDialog.exec_(self) == 1:
@@ -33,6 +33,7 @@ _NORMALIZATIONS = {
     'Discrete Probability Distribution': ('unity', 'Probability'),
     'Probability Density Distribution': ('density', 'Probability Density'),
 }
+_NORMALIZATION_NAMES = list(_NORMALIZATIONS.keys())
 
 
 class Histogram:
@@ -113,11 +114,8 @@ class HistogramDialog(QtWidgets.QDialog):
         QtWidgets.QDialog.__init__(self)
         self.ui = Ui_Dialog()
         self.ui.setupUi(self)
-        self.ui.signal.addItem("current")
-        self.ui.signal.addItem("voltage")
-        self.ui.signal.addItem("power")
-        for name in _NORMALIZATIONS.keys():
-            self.ui.normalization.addItem(name)
+        self.ui.signal.addItems(plugin_helpers.SIGNAL_NAMES)
+        self.ui.normalization.addItems(_NORMALIZATION_NAMES)
 
     def exec_(self):
         if QtWidgets.QDialog.exec_(self) == 1:
@@ -69,9 +69,7 @@ class MaxWindowDialog(QtWidgets.QDialog):
         QtWidgets.QDialog.__init__(self)
         self.ui = Ui_Dialog()
         self.ui.setupUi(self)
-        self.ui.signal.addItem("current")
-        self.ui.signal.addItem("voltage")
-        self.ui.signal.addItem("power")
+        self.ui.signal.addItems(plugin_helpers.SIGNAL_NAMES)
         self.ui.time_len.setMaximum(max_time_len)
         starting_value = 10 ** np.round(np.log10(max_time_len / 1000))
         value = min(max_time_len, max(0.00001, starting_value))
@@ -18,6 +18,7 @@ from math import ceil
 from collections import deque
 
 log = logging.getLogger(__name__)
+SIGNAL_NAMES = ['current', 'voltage', 'power']
 
 
 def calculate_histogram(data, bins: int, signal: str):
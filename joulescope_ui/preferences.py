@@ -49,16 +49,15 @@ DTYPES_DEF = [
     ('none', None),  # not stored, but used to signal events
     ('container', )]
 DTYPES = [item for sublist in DTYPES_DEF for item in sublist]
-DTYPES_MAP = {}
-for t in DTYPES_DEF:
-    for k in t:
-        DTYPES_MAP[k] = t[0]
+DTYPES_MAP = {k: t[0] for t in DTYPES_DEF for k in t}
+_FALSE_STRINGS = frozenset(['false', '0', 'off', ''])
+_BOOL_FALSE_VALUES = frozenset(['off', '0', 'None', 'none'])  # dtype bool validation
 
 
 def to_bool(v):
     if isinstance(v, str):
         v = v.lower()
-        return v not in ['false', '0', 'off', '']
+        return v not in _FALSE_STRINGS
     return bool(v)
 
 
@@ -71,7 +70,9 @@ def options_enum(options):
         return options
     if callable(options):
         options = options()
-    if isinstance(options, collections.abc.Mapping) and '__def__' in options:
+    if isinstance(options, collections.abc.Mapping) and '__enum__' in options:
+        return options['__enum__']
+    elif isinstance(options, collections.abc.Mapping) and '__def__' in options:
         return list(options['__def__'].keys())
     elif isinstance(options, collections.abc.Mapping):
         return list(options.keys())
@@ -131,6 +132,59 @@ def validate_color(value):
     return c.getRgb()
 
 
+def _validate_passthrough(value, options):
+    return value
+
+
+def _validate_str(value, options):
+    if not isinstance(value, str):
+        raise ValueError(f'expected str {value}')
+    return options_str_validate(options, value)
+
+
+def _validate_int(value, options):
+    return options_int_validate(options, value)
+
+
+def _validate_float(value, options):
+    return float(value)
+
+
+def _validate_bool(value, options):
+    if isinstance(value, str) and value in _BOOL_FALSE_VALUES:
+        return False
+    return bool(value)
+
+
+def _validate_bytes(value, options):
+    return isinstance(value, bytes)
+
+
+def _validate_dict(value, options):
+    if not hasattr(value, 'keys'):
+        raise ValueError(f'dtype dict but no keys')
+    return value
+
+
+def _validate_color(value, options):
+    return validate_color(value)
+
+
+_VALIDATORS = {  # dtype: fn(value, options)
+    'obj': _validate_passthrough,
+    'str': _validate_str,
+    'int': _validate_int,
+    'float': _validate_float,
+    'bool': _validate_bool,
+    'bytes': _validate_bytes,
+    'dict': _validate_dict,
+    'color': _validate_color,
+    'font': _validate_passthrough,
+    'container': _validate_passthrough,
+    'none': _validate_passthrough,
+}
+
+
 def validate(value, dtype, options=None):
     """Ensure that a value is valid.
 
@@ -140,37 +194,10 @@ def validate(value, dtype, options=None):
     :return: The conforming value.
     :raise ValueError: on invalid value.
     """
-    if dtype == 'obj':
-        pass  # no validation necessary
-    elif dtype == 'str':
-        if not isinstance(value, str):
-            raise ValueError(f'expected str {value}')
-        value = options_str_validate(options, value)
-    elif dtype == 'int':
-        return options_int_validate(options, value)
-    elif dtype == 'float':
-        return float(value)
-    elif dtype == 'bool':
-        if isinstance(value, str) and value in ['off', '0', 'None', 'none']:
-            return False
-        return bool(value)
-    elif dtype == 'bytes':
-        return isinstance(value, bytes)
-    elif dtype == 'dict':
-        if not hasattr(value, 'keys'):
-            raise ValueError(f'dtype dict but no keys')
-        return value
-    elif dtype == 'color':
-        return validate_color(value)
-    elif dtype == 'font':
-        return value
-    elif dtype == 'container':
-        return value
-    elif dtype == 'none':
-        return value
-    else:
+    fn = _VALIDATORS.get(dtype)
+    if fn is None:
         raise ValueError(f'unsupported dtype {dtype}')
-    return value
+    return fn(value, options)
 
 
 def is_valid(value, dtype, options=None):
@@ -207,6 +234,7 @@ def options_conform(options):
     r = {
         '__def__': options,  # option definition
         '__remap__': remap,  #
+        '__enum__': tuple(options.keys()),  # option names, in definition order
     }
     for key, value in options.items():
         remap[key] = key
@@ -66,11 +66,13 @@ class AppearanceColors(QtWidgets.QWidget):
         clear_layout(self._layout)
         self._widgets.clear()
 
+    @QtCore.Slot()
     def _on_timer(self):
         index = theme_update(self._index)
         topic = 'Appearance/__index__'
         self._cmdp.invoke('!preferences/preference/set', (topic, index, self._profile))
 
+    @QtCore.Slot(str, str)
     def _on_change(self, color_name, color_value):
         self._index['colors'][color_name] = color_value
         self._timer.stop()
@@ -90,6 +92,10 @@ class PreferencesDialog(QtWidgets.QDialog):
         self.ui = Ui_PreferencesDialog()
         self.ui.setupUi(self)
         self._target_widget = None
+        self._redraw_timer = QtCore.QTimer(self)  # coalesce right pane redraw requests
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(0)
+        self._redraw_timer.timeout.connect(self._on_redraw_timer)
 
         self._definitions = self._cmdp.preferences.definitions
         if self._definitions['name'] != '/':
@@ -132,12 +138,14 @@ class PreferencesDialog(QtWidgets.QDialog):
         topic = 'Appearance/__index__'
         self._cmdp.invoke('!preferences/preference/set', (topic, theme_index, profile))
 
+    @QtCore.Slot()
     def _help(self):
         display_help(self, self._cmdp, 'preferences')
 
     def _refresh(self, topic, value):
         self._redraw_right_pane()
 
+    @QtCore.Slot(int)
     def _on_profile_combo_box_change(self, index):
         profile = self.ui.profileComboBox.currentText()
         self._profile_change(profile)
@@ -161,10 +169,12 @@ class PreferencesDialog(QtWidgets.QDialog):
             self._profile_combobox_update()
         self._redraw_right_pane()
 
+    @QtCore.Slot()
     def _on_profile_activate_button(self):
         self._cmdp.invoke('!preferences/profile/set', self._active_profile)
         self.ui.profileActivateButton.setEnabled(False)
 
+    @QtCore.Slot()
     def _on_profile_reset_button(self):
         self._profile_reset()
 
@@ -194,6 +204,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         self._cmdp.invoke(self._refresh_topic, None)
         log.info('profile_reset done %s : %s', self._active_profile, prefix)
 
+    @QtCore.Slot()
     def _on_profile_new_button(self):
         profile, success = QtWidgets.QInputDialog.getText(self, 'Enter profile name', 'Profile Name:')
         if not success:
@@ -267,14 +278,15 @@ class PreferencesDialog(QtWidgets.QDialog):
 
         self._target_widget = QtWidgets.QWidget()
         self._target_widget.setContentsMargins(0, 0, 0, 0)
-        self.ui.targetLayout.addWidget(self._target_widget)
         self._active_group = data['name']
+        # populate while detached so the dialog lays out the group only once
         for name, child in data['children'].items():
             if 'children' in child:
                 continue
             if '#' in name or name.startswith('_') or child['name'].endswith('/'):
                 continue
             self._populate_entry(name, child)
+        self.ui.targetLayout.addWidget(self._target_widget)
 
     def _populate_entry(self, name, entry):
         p = widget_factory(self._cmdp, entry['name'], profile=self._active_profile)
@@ -282,6 +294,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             p.populate(self._target_widget)
             self._params.append(p)
 
+    @QtCore.Slot()
     def preferences_reset(self):
         self._profile_reset(self._active_group)
 
@@ -289,12 +302,17 @@ class PreferencesDialog(QtWidgets.QDialog):
         self._cmdp.invoke('!command_group/start')
         rv = QtWidgets.QDialog.exec_(self)
         self._cmdp.invoke('!command_group/end')
+        self._redraw_timer.stop()
         self._clear()
         if rv == 0:
             self._cmdp.invoke('!undo')
         return rv
 
     def _redraw_right_pane(self):
+        self._redraw_timer.start()
+
+    @QtCore.Slot()
+    def _on_redraw_timer(self):
         self._clear()
         self._on_tree_item_changed(self.ui.treeView.currentIndex(), None)
 
@@ -324,7 +342,7 @@ def _int_factory(entry, name, value, tooltip):
 def widget_factory(cmdp, topic, profile=None):
     value = cmdp.preferences.get(topic, profile=profile)
     entry = cmdp.preferences.definition_get(topic)
-    name = topic.split('/')[-1]
+    name = topic[topic.rfind('/') + 1:]
     p = None
     tooltip = ''
     dtype = entry.get('dtype', 'str')
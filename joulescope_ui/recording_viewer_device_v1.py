@@ -21,6 +21,7 @@ from joulescope import span
 import os
 import numpy as np
 import threading
+import collections
 import queue
 import weakref
 import logging
@@ -31,6 +32,10 @@ TIMEOUT = 10.0
 
 class RecordingView:
     """A user-interface-compatible device that displays previous recorded data"""
+
+    __slots__ = ('_parent', '_x_range', '_span', '_x', '_samples_per', '_refresh_requested',
+                 '_cache', 'on_update_fn', '_log')
+
     def __init__(self, parent):
         self._parent = weakref.ref(parent)
         self._x_range = [0.0, 1.0]
@@ -228,6 +233,21 @@ class RecordingView:
         return self._parent()._post_block('ping', self, (args, kwargs))
 
 
+# command -> callable(device, view, args) for the view thread
+_CMD_PROCESS = {
+    'refresh': lambda device, view, args: setattr(view, '_refresh_requested', True),
+    'on_x_change': lambda device, view, args: view._on_x_change(*args),
+    'samples_get': lambda device, view, args: view._samples_get(**args),
+    'statistics_get': lambda device, view, args: view._statistics_get(**args),
+    'statistics_get_multiple': lambda device, view, args: view._statistics_get_multiple(**args),
+    'view_factory': lambda device, view, args: device._view_add(args),
+    'view_close': lambda device, view, args: device._view_remove(args),
+    'open': lambda device, view, args: None,
+    'close': lambda device, view, args: device._close(),
+    'ping': lambda device, view, args: args,
+}
+
+
 class RecordingViewerDeviceV1:
     """A user-interface-compatible device that displays previous recorded data
 
@@ -244,7 +264,8 @@ class RecordingViewerDeviceV1:
         self._views = []
         self._coalesce = {}
         self._thread = None
-        self._cmd_queue = queue.Queue()  # tuples of (command, args, callback)
+        self._cmd_queue = collections.deque()  # tuples of (command, view, args, callback)
+        self._cmd_event = threading.Event()
         self._response_queue = queue.Queue()
         self._quit = False
         self._log = logging.getLogger(__name__)
@@ -278,30 +299,11 @@ class RecordingViewerDeviceV1:
         rv = None
         try:
             # self._log.debug('_cmd_process %s - start', cmd)
-            if cmd == 'refresh':
-                view._refresh_requested = True
-            elif cmd == 'on_x_change':
-                rv = view._on_x_change(*args)
-            elif cmd == 'samples_get':
-                rv = view._samples_get(**args)
-            elif cmd == 'statistics_get':
-                rv = view._statistics_get(**args)
-            elif cmd == 'statistics_get_multiple':
-                rv = view._statistics_get_multiple(**args)
-            elif cmd == 'view_factory':
-                self._views.append(args)
-                rv = args
-            elif cmd == 'view_close':
-                if args in self._views:
-                    self._views.remove(args)
-            elif cmd == 'open':
-                rv = None
-            elif cmd == 'close':
-                rv = self._close()
-            elif cmd == 'ping':
-                rv = args
-            else:
+            fn = _CMD_PROCESS.get(cmd)
+            if fn is None:
                 self._log.warning('unsupported command %s', cmd)
+            else:
+                rv = fn(self, view, args)
         except Exception:
             self._log.exception('While running command')
         if callable(cbk):
@@ -310,14 +312,24 @@ class RecordingViewerDeviceV1:
             except Exception:
                 self._log.exception('in callback')
 
+    def _view_add(self, view):
+        self._views.append(view)
+        return view
+
+    def _view_remove(self, view):
+        if view in self._views:
+            self._views.remove(view)
+
     def run(self):
         cmd_count = 0
         timeout = 1.0
         self._log.info('RecordingViewerDevice.start')
         while not self._quit:
-            try:
-                cmd, view, args, cbk = self._cmd_queue.get(timeout=timeout)
-            except queue.Empty:
+            if not self._cmd_queue:
+                if timeout:
+                    self._cmd_event.wait(timeout=timeout)
+                    self._cmd_event.clear()
+            if not self._cmd_queue:
                 timeout = 1.0
                 for value in self._coalesce.values():
                     self._cmd_process(*value)
@@ -327,6 +339,7 @@ class RecordingViewerDeviceV1:
                         view._update()
                 cmd_count = 0
                 continue
+            cmd, view, args, cbk = self._cmd_queue.popleft()
             cmd_count += 1
             timeout = 0.0
             try:
@@ -344,20 +357,24 @@ class RecordingViewerDeviceV1:
         if self._thread is None:
             self._log.info('RecordingViewerDevice._post(%s) when thread not running', command)
         else:
-            self._cmd_queue.put((command, view, args, cbk))
+            self._cmd_queue.append((command, view, args, cbk))
+            self._cmd_event.set()
 
     def _post_block(self, command, view=None, args=None, timeout=None):
         timeout = TIMEOUT if timeout is None else float(timeout)
         # self._log.debug('_post_block %s start', command)
-        while not self._response_queue.empty():
-            self._log.warning('response queue not empty')
+        stale_count = 0
+        while True:  # drain stale responses
             try:
-                self._response_queue.get(timeout=0.0)
+                self._response_queue.get_nowait()
             except queue.Empty:
-                pass
+                break
+            stale_count += 1
+        if stale_count:
+            self._log.warning('response queue not empty: %d', stale_count)
         if self._thread is None:
             raise IOError('View thread not running')
-        self._post(command, view, args, lambda rv_=None: self._response_queue.put(rv_))
+        self._post(command, view, args, self._response_queue.put)
         try:
             rv = self._response_queue.get(timeout=timeout)
         except queue.Empty as ex:
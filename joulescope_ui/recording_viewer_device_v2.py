@@ -19,6 +19,7 @@ from .widgets.waveform.annotations import AnnotationLoader
 import os
 import numpy as np
 import threading
+import collections
 import queue
 import weakref
 import logging
@@ -29,6 +30,10 @@ TIMEOUT = 10.0
 
 class RecordingView:
     """A user-interface-compatible device that displays previous recorded data"""
+
+    __slots__ = ('_parent', '_x_range', '_span', '_x', '_samples_per', '_refresh_requested',
+                 '_cache', 'on_update_fn', '_log')
+
     def __init__(self, parent):
         self._parent = weakref.ref(parent)
         self._x_range = [0.0, 1.0]
@@ -83,6 +88,10 @@ class RecordingView:
     def _reader(self):
         return self._parent()._reader
 
+    @property
+    def _fsr_signals(self):
+        return self._parent()._fsr_signals
+
     @property
     def voltage_range(self):
         return 0
@@ -162,12 +171,8 @@ class RecordingView:
             'signals': {},
         }
 
-        for signal in reader.signals.values():
+        for signal in self._fsr_signals:
             signal_id = signal.signal_id
-            if signal_id == 0:
-                continue
-            if signal.signal_type != SignalType.FSR:
-                continue
             units = signal.units
             try:
                 if incr > 1:
@@ -271,9 +276,7 @@ class RecordingView:
             },
             'signals': {},
         }
-        for signal in r.signals.values():
-            if signal.signal_id == 0 or signal.signal_type != SignalType.FSR:
-                continue
+        for signal in self._fsr_signals:
             if fields is not None and signal.name not in fields:
                 continue
             f = signal.sample_rate
@@ -346,6 +349,21 @@ class RecordingView:
         return self._parent()._post_block('ping', self, (args, kwargs))
 
 
+# command -> callable(device, view, args) for the view thread
+_CMD_PROCESS = {
+    'refresh': lambda device, view, args: setattr(view, '_refresh_requested', True),
+    'on_x_change': lambda device, view, args: view._on_x_change(*args),
+    'samples_get': lambda device, view, args: view._samples_get(**args),
+    'statistics_get': lambda device, view, args: view._statistics_get(**args),
+    'statistics_get_multiple': lambda device, view, args: view._statistics_get_multiple(**args),
+    'view_factory': lambda device, view, args: device._view_add(args),
+    'view_close': lambda device, view, args: device._view_remove(args),
+    'open': lambda device, view, args: None,
+    'close': lambda device, view, args: device._close(),
+    'ping': lambda device, view, args: args,
+}
+
+
 class RecordingViewerDeviceV2:
     """A user-interface-compatible device that displays previous recorded data
 
@@ -358,11 +376,13 @@ class RecordingViewerDeviceV2:
         self._filename = filename
         self._cmdp = cmdp
         self._reader: Reader = None
+        self._fsr_signals = ()  # reader signals displayed by views, resolved on open
         self._default_signal: SignalDef = None
         self._views = []
         self._coalesce = {}
         self._thread = None
-        self._cmd_queue = queue.Queue()  # tuples of (command, args, callback)
+        self._cmd_queue = collections.deque()  # tuples of (command, view, args, callback)
+        self._cmd_event = threading.Event()
         self._response_queue = queue.Queue()
         self._quit = False
         self._log = logging.getLogger(__name__)
@@ -399,30 +419,11 @@ class RecordingViewerDeviceV2:
         rv = None
         try:
             # self._log.debug('_cmd_process %s - start', cmd)
-            if cmd == 'refresh':
-                view._refresh_requested = True
-            elif cmd == 'on_x_change':
-                rv = view._on_x_change(*args)
-            elif cmd == 'samples_get':
-                rv = view._samples_get(**args)
-            elif cmd == 'statistics_get':
-                rv = view._statistics_get(**args)
-            elif cmd == 'statistics_get_multiple':
-                rv = view._statistics_get_multiple(**args)
-            elif cmd == 'view_factory':
-                self._views.append(args)
-                rv = args
-            elif cmd == 'view_close':
-                if args in self._views:
-                    self._views.remove(args)
-            elif cmd == 'open':
-                rv = None
-            elif cmd == 'close':
-                rv = self._close()
-            elif cmd == 'ping':
-                rv = args
-            else:
+            fn = _CMD_PROCESS.get(cmd)
+            if fn is None:
                 self._log.warning('unsupported command %s', cmd)
+            else:
+                rv = fn(self, view, args)
         except Exception:
             self._log.exception('While running command')
         if callable(cbk):
@@ -431,14 +432,24 @@ class RecordingViewerDeviceV2:
             except Exception:
                 self._log.exception('in callback')
 
+    def _view_add(self, view):
+        self._views.append(view)
+        return view
+
+    def _view_remove(self, view):
+        if view in self._views:
+            self._views.remove(view)
+
     def run(self):
         cmd_count = 0
         timeout = 1.0
         self._log.info('RecordingViewerDevice.start')
         while not self._quit:
-            try:
-                cmd, view, args, cbk = self._cmd_queue.get(timeout=timeout)
-            except queue.Empty:
+            if not self._cmd_queue:
+                if timeout:
+                    self._cmd_event.wait(timeout=timeout)
+                    self._cmd_event.clear()
+            if not self._cmd_queue:
                 timeout = 1.0
                 for value in self._coalesce.values():
                     self._cmd_process(*value)
@@ -448,6 +459,7 @@ class RecordingViewerDeviceV2:
                         view._update()
                 cmd_count = 0
                 continue
+            cmd, view, args, cbk = self._cmd_queue.popleft()
             cmd_count += 1
             timeout = 0.0
             try:
@@ -465,20 +477,24 @@ class RecordingViewerDeviceV2:
         if self._thread is None:
             self._log.info('RecordingViewerDevice._post(%s) when thread not running', command)
         else:
-            self._cmd_queue.put((command, view, args, cbk))
+            self._cmd_queue.append((command, view, args, cbk))
+            self._cmd_event.set()
 
     def _post_block(self, command, view=None, args=None, timeout=None):
         timeout = TIMEOUT if timeout is None else float(timeout)
         # self._log.debug('_post_block %s start', command)
-        while not self._response_queue.empty():
-            self._log.warning('response queue not empty')
+        stale_count = 0
+        while True:  # drain stale responses
             try:
-                self._response_queue.get(timeout=0.0)
+                self._response_queue.get_nowait()
             except queue.Empty:
-                pass
+                break
+            stale_count += 1
+        if stale_count:
+            self._log.warning('response queue not empty: %d', stale_count)
         if self._thread is None:
             raise IOError('View thread not running')
-        self._post(command, view, args, lambda rv_=None: self._response_queue.put(rv_))
+        self._post(command, view, args, self._response_queue.put)
         try:
             rv = self._response_queue.get(timeout=timeout)
         except queue.Empty as ex:
@@ -504,6 +520,8 @@ class RecordingViewerDeviceV2:
         signals = self._reader.signals
         if len(signals) <= 1:
             raise RuntimeError('This JLS file is not currently supported')
+        self._fsr_signals = tuple(s for s in signals.values()
+                                  if s.signal_id != 0 and s.signal_type == SignalType.FSR)
         self._default_signal = signals[1]
         self._loader = AnnotationLoader(self._parent, self._filename, self._cmdp)
         self._loader.signals.finished.connect(self._on_annotations_loaded)
@@ -515,6 +533,7 @@ class RecordingViewerDeviceV2:
         if self._reader is not None:
             self._reader.close()
             self._reader = None
+        self._fsr_signals = ()
         self._quit = True
 
     def view_factory(self):
@@ -210,6 +210,16 @@ class TestCommandProcessor(unittest.TestCase):
     def test_unsubscribe_when_not_subscribed(self):
         self.c.unsubscribe('hello', self.execute_ignore)
 
+    def test_subscribe_list(self):
+        self.c.define('hello', default='world')
+        self.c.define('there', default='you')
+        self.c.subscribe(['hello', 'there'], self.execute_ignore, update_now=True)
+        self.assertEqual([('hello', 'world'), ('there', 'you')], self.commands)
+        self.c.unsubscribe(['hello', 'there'], self.execute_ignore)
+        self.c.publish('hello', '1')
+        self.c.publish('there', '2')
+        self.assertEqual([('hello', 'world'), ('there', 'you')], self.commands)
+
     def define_group(self, preferences=None):
         if preferences is None:
             c = self.c
@@ -19,7 +19,7 @@ Test the preferences
 import unittest
 import json
 import os
-from joulescope_ui.preferences import Preferences, validate, options_conform, BASE_PROFILE
+from joulescope_ui.preferences import Preferences, validate, options_conform, options_enum, BASE_PROFILE
 from joulescope_ui import paths
 
 
@@ -194,6 +194,12 @@ class TestPreferences(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate('d', 'str', options=options)
 
+    def test_options_enum_definition_order(self):
+        options = options_conform(['c', 'a', 'b'])
+        self.assertEqual(('c', 'a', 'b'), options_enum(options))
+        options = options_conform({'c': {}, 'a': {'aliases': ['x']}, 'b': {}})
+        self.assertEqual(('c', 'a', 'b'), options_enum(options))
+
     def test_options_callable_list(self):
         self.assertEqual('a', validate('a', 'str', options=lambda: ['a']))
         with self.assertRaises(ValueError):
@@ -270,6 +276,35 @@ class TestPreferences(unittest.TestCase):
     def test_validate_font(self):
         validate('Monospaced', 'font')
 
+    def test_validate_each_dtype(self):
+        obj = object()
+        cases = [  # value, dtype, options, expected
+            (obj, 'obj', None, obj),
+            ('there', 'str', None, 'there'),
+            ('b', 'str', options_conform(['a', 'b']), 'b'),
+            ('c', 'str', options_conform({'a': {'aliases': ['c']}}), 'a'),
+            ('2', 'int', None, 2),
+            ('2.5', 'float', None, 2.5),
+            ('on', 'bool', None, True),
+            ('off', 'bool', None, False),
+            ('0', 'bool', None, False),
+            ('None', 'bool', None, False),
+            ('none', 'bool', None, False),
+            (b'12345', 'bytes', None, True),
+            ({'a': 1}, 'dict', None, {'a': 1}),
+            ('red', 'color', None, (255, 0, 0, 255)),
+            ('Monospaced', 'font', None, 'Monospaced'),
+            ('hi', 'container', None, 'hi'),
+            ('hi', 'none', None, 'hi'),
+        ]
+        for value, dtype, options, expected in cases:
+            with self.subTest(dtype=dtype, value=value):
+                self.assertEqual(expected, validate(value, dtype, options))
+
+    def test_validate_unsupported_dtype(self):
+        with self.assertRaises(ValueError):
+            validate('hi', 'unsupported')
+
     def test_set_invalid_type(self):
         self.p.define(name='hello', dtype='str', default='world')
         with self.assertRaises(ValueError):
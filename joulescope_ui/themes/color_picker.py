@@ -131,20 +131,24 @@ class ColorItem(QtCore.QObject):
         self.color_label = QColorLabel(parent, color)
         self.color_label.color_changed.connect(self._on_color)
 
+    @QtCore.Slot(str)
     def _on_text(self, text):
-        if self.value_edit.hasAcceptableInput():
-            self.value_edit.setProperty('has_acceptable_input', True)
+        acceptable = self.value_edit.hasAcceptableInput()
+        if acceptable:
             self._on_color(text)
-        else:
-            self.value_edit.setProperty('has_acceptable_input', False)
-        self.value_edit.style().unpolish(self.value_edit)
-        self.value_edit.style().polish(self.value_edit)
+        if self.value_edit.property('has_acceptable_input') != acceptable:
+            self.value_edit.setProperty('has_acceptable_input', acceptable)
+            self.value_edit.style().unpolish(self.value_edit)
+            self.value_edit.style().polish(self.value_edit)
 
+    @QtCore.Slot(str)
     def _on_color(self, color):
+        changed = color != self._color
         self._color = color
         self.value_edit.setText(color)
         self.color_label.color = color
-        self.color_changed.emit(self._name, self._color)
+        if changed:  # each emit restarts the theme re-render timer
+            self.color_changed.emit(self._name, self._color)
 
 
 class ColorPicker(QtWidgets.QWidget):
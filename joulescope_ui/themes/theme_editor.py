@@ -49,8 +49,7 @@ class ThemeEditor(QtWidgets.QWidget):
         self._theme_label = QtWidgets.QLabel('Theme: ', self._top)
         self._top_layout.addWidget(self._theme_label)
         self._theme_combo = QtWidgets.QComboBox(self._top)
-        for theme in self._themes:
-            self._theme_combo.addItem(theme)
+        self._theme_combo.addItems(list(self._themes))
         self._top_layout.addWidget(self._theme_combo)
 
         self._middle_scroll = QtWidgets.QScrollArea(self)
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from PySide2 import QtGui, QtWidgets
+from PySide2 import QtCore, QtGui, QtWidgets
+from contextlib import contextmanager
 import subprocess
 import os
 import logging
@@ -32,6 +33,22 @@ SIZE_POLICY_MAP = {
 }
 
 
+@contextmanager
+def signals_blocked(widget):
+    """Block the Qt signals of a widget for the duration of the context.
+
+    :param widget: The QObject whose signals to block.
+
+    The previous blocked state is restored on exit, even if the
+    context body raises.
+    """
+    blocker = QtCore.QSignalBlocker(widget)
+    try:
+        yield widget
+    finally:
+        blocker.unblock()
+
+
 def comboBoxConfig(comboBox, values, default=None):
     """Configure (or reconfigure) a QT combo box.
 
@@ -43,6 +60,7 @@ def comboBoxConfig(comboBox, values, default=None):
         item.
     :return: The new text value for the combobox.
     """
+    values = list(values)
     if default is not None and default not in values:
         log.warning('Ignoring default value "%s" since it is not in values: %s' % (default, values))
         default = None
@@ -52,13 +70,11 @@ def comboBoxConfig(comboBox, values, default=None):
         if currentValue in values:
             default = currentValue
 
-    block_state = comboBox.blockSignals(True)
-    comboBox.clear()
-    for value in values:
-        comboBox.addItem(value)
-        if value == default:
-            comboBox.setCurrentIndex(comboBox.count() - 1)
-    comboBox.blockSignals(block_state)
+    with signals_blocked(comboBox):
+        comboBox.clear()
+        comboBox.addItems(values)
+        if default is not None:
+            comboBox.setCurrentIndex(values.index(default))
     return str(comboBox.currentText())
 
 
@@ -81,12 +97,14 @@ def comboBoxIncrement(box):
 
 def comboBoxSelectItemByText(combobox: QtWidgets.QComboBox, value, block=False):
     index = combobox.findText(value)
-    if index >= 0:
-        if block:
-            block_state = combobox.blockSignals(True)
+    if index < 0:
+        return index
+    if not block:
+        combobox.setCurrentIndex(index)
+        return index
+    with signals_blocked(combobox):
         combobox.setCurrentIndex(index)
-        if block:
-            combobox.blockSignals(block_state)
+    return index
 
 
 def confirmDiscard(parent):
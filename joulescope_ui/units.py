@@ -37,6 +37,9 @@ UNIT_CONVERTER = {
 }
 
 
+ELAPSED_TIME_STANDARD_FORMATS = frozenset(['D:hh:mm:ss', 'conventional', 'standard'])
+
+
 def convert_units(value, input_units, output_units):
     key = (input_units, output_units)
     fn = UNIT_CONVERTER.get(key)
@@ -66,7 +69,7 @@ def elapsed_time_formatter(seconds, cmdp=None, fmt=None):
             fmt = cmdp
         else:
             fmt = cmdp['Units/elapsed_time']
-    if seconds >= 60 and fmt in ['D:hh:mm:ss', 'conventional', 'standard']:
+    if seconds >= 60 and fmt in ELAPSED_TIME_STANDARD_FORMATS:
         days = seconds // (24 * 60 * 60)
         seconds -= days * (24 * 60 * 60)
         hours = seconds // (60 * 60)
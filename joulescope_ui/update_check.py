@@ -58,7 +58,7 @@ def version_to_str(v):
         v = str_to_version(v)
     if len(v) != 3:
         raise ValueError('invalid version - needs [major, minor, patch]')
-    return '.'.join(str(x) for x in v)
+    return f'{v[0]}.{v[1]}.{v[2]}'
 
 
 def current_version():
@@ -15,9 +15,11 @@
 
 
 from PySide2 import QtWidgets, QtCore
+from joulescope_ui.widgets.accum_label import AccumLabel
 from joulescope_ui.widgets.switch import Switch
 from joulescope.units import three_sig_figs
 from joulescope_ui.units import convert_units
+from joulescope_ui.ui_util import comboBoxConfig, comboBoxSelectItemByText, signals_blocked
 import logging
 import weakref
 
@@ -106,6 +108,25 @@ Right click for more options.
 """
 
 
+BLINK_BUTTON_SIZE = QtCore.QSize(24, 24)
+
+DEVICE_STATE_TOPICS = [  # the Device/#state topics handled by ControlWidget, in definition order
+    'Device/#state/source',
+    'Device/#state/play',
+    'Device/#state/record',
+    'Device/#state/record_statistics',
+    'Device/#state/statistics',
+]
+
+STREAMING_SOURCES = frozenset(['USB', 'Buffer'])
+
+
+def _button_checked_set(button, checked):
+    """Set a button's checked state without emitting toggled."""
+    with signals_blocked(button):
+        button.setChecked(checked)
+
+
 class AccumMenu(QtWidgets.QMenu):
 
     def __init__(self, parent, cmdp):
@@ -116,14 +137,22 @@ class AccumMenu(QtWidgets.QMenu):
         self.accum_clear = self.addAction('&Clear')
         self.accum_clear.triggered.connect(self._on_clear)
 
-        field = cmdp['Units/accumulator']
-        self._next_field = 'energy' if field == 'charge' else 'charge'
-        self.field = self.addAction(f'&Show {self._next_field}')
+        self._next_field = None
+        self.field = self.addAction('')
         self.field.triggered.connect(self._on_field_switch)
+        self.field_update()
 
+    def field_update(self):
+        """Update the field switch action to match Units/accumulator."""
+        field = self._cmdp['Units/accumulator']
+        self._next_field = 'energy' if field == 'charge' else 'charge'
+        self.field.setText(f'&Show {self._next_field}')
+
+    @QtCore.Slot()
     def _on_clear(self):
         self._cmdp.invoke('!Accumulators/reset', None)
 
+    @QtCore.Slot()
     def _on_field_switch(self):
         self._cmdp.publish('Units/accumulator', self._next_field)
 
@@ -141,8 +170,7 @@ class ControlWidget(QtWidgets.QWidget):
         self._playButton.setProperty('blink', False)
         self._playButton.setCheckable(True)
         self._playButton.setFlat(True)
-        self._playButton.setProperty('blink', False)
-        self._playButton.setFixedSize(24, 24)
+        self._playButton.setFixedSize(BLINK_BUTTON_SIZE)
         self._layout.addWidget(self._playButton)
 
         self._recordButton = QtWidgets.QPushButton(self)
@@ -151,7 +179,7 @@ class ControlWidget(QtWidgets.QWidget):
         self._recordButton.setProperty('blink', False)
         self._recordButton.setCheckable(True)
         self._recordButton.setFlat(True)
-        self._recordButton.setFixedSize(24, 24)
+        self._recordButton.setFixedSize(BLINK_BUTTON_SIZE)
         self._layout.addWidget(self._recordButton)
 
         self._recordStatisticsButton = QtWidgets.QPushButton(self)
@@ -160,7 +188,7 @@ class ControlWidget(QtWidgets.QWidget):
         self._recordStatisticsButton.setProperty('blink', False)
         self._recordStatisticsButton.setCheckable(True)
         self._recordStatisticsButton.setFlat(True)
-        self._recordStatisticsButton.setFixedSize(24, 24)
+        self._recordStatisticsButton.setFixedSize(BLINK_BUTTON_SIZE)
         self._layout.addWidget(self._recordStatisticsButton)
 
         self._iRangeLabel = QtWidgets.QLabel(self)
@@ -190,12 +218,9 @@ class ControlWidget(QtWidgets.QWidget):
         self._vRangeComboBox.setToolTip(VRANGE_TOOLTIP)
         self._layout.addWidget(self._vRangeComboBox)
 
-        self._horizontalSpacer = QtWidgets.QSpacerItem(40, 20,
-                                                       QtWidgets.QSizePolicy.Expanding,
-                                                       QtWidgets.QSizePolicy.Minimum)
-        self._layout.addItem(self._horizontalSpacer)
+        self._layout.addStretch(1)
 
-        self._accumLabel = QtWidgets.QLabel(self)
+        self._accumLabel = AccumLabel(self)
         self._accumLabel.setObjectName(u"accumLabel")
         self._accumLabel.setTextFormat(QtCore.Qt.RichText)
         self._accumLabel.setText('<html><head/><body></body</html>')
@@ -207,21 +232,26 @@ class ControlWidget(QtWidgets.QWidget):
         self._recordStatisticsButton.setToolTip(STATISTICS_TOOLTIP)
 
         self.setVisible(False)
-        self._accum_history = None
+        self._accum_history = None  # (time_str, accumulators)
         self._accum_menu = None
 
         self._populate_combobox(self._iRangeComboBox, 'Device/setting/i_range')
         self._populate_combobox(self._vRangeComboBox, 'Device/setting/v_range')
 
-        self._cmdp.subscribe('Device/setting/', self._on_device_parameter, update_now=True)
-        self._cmdp.subscribe('Device/#state/', self._on_device_state, update_now=True)
+        self._cmdp.subscribe('Device/setting/', self._on_device_parameter)
+        for topic in ['Device/setting/i_range', 'Device/setting/v_range']:
+            self._on_device_parameter(topic, self._cmdp[topic])
+        self._cmdp.subscribe('Device/#state/', self._on_device_state)
+        for topic in DEVICE_STATE_TOPICS:  # initial state, skip unhandled topics
+            if topic in self._cmdp:
+                self._on_device_state(topic, self._cmdp[topic])
         self._cmdp.subscribe('Units/accumulator', self._on_accumulator)
         self._cmdp.subscribe('!Accumulators/reset', self._on_accumulator_reset)
         self._playButton.toggled.connect(self._on_play_button_toggled)
         self._recordButton.toggled.connect(self._on_record_button_toggled)
         self._recordStatisticsButton.toggled.connect(self._on_record_statistics_button_toggled)
         self._switch.toggled.connect(self._on_switch_toggled)
-        self._accumLabel.mousePressEvent = self._on_accum_mousePressEvent
+        self._accumLabel.mousePressed.connect(self._on_accum_mousePressEvent)
 
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
         h = self.minimumSizeHint().height()
@@ -229,74 +259,88 @@ class ControlWidget(QtWidgets.QWidget):
         self.setMaximumHeight(h)
 
         self._blink = True
+        self._blink_buttons = (self._playButton, self._recordButton, self._recordStatisticsButton)
         self._timer = QtCore.QTimer()
-        self._timer.timeout.connect(self._on_timer)
+        self._timer.timeout.connect(self._on_timer)  # started by showEvent
+
+    def showEvent(self, event):
         self._timer.start(1000)
+        QtWidgets.QWidget.showEvent(self, event)
 
-    def _on_timer(self):
-        self._blink = not self._blink
-        for b in [self._playButton, self._recordButton, self._recordStatisticsButton]:
-            b.setProperty('blink', self._blink)
-            b.style().unpolish(b)
-            b.style().polish(b)
+    def hideEvent(self, event):
+        self._timer.stop()
+        QtWidgets.QWidget.hideEvent(self, event)
 
+    @QtCore.Slot()
+    def _on_timer(self):
+        blink = not self._blink
+        self._blink = blink
+        for b in self._blink_buttons:
+            if not b.isChecked():
+                continue  # style only blinks when checked
+            b.setProperty('blink', blink)
+            b.style().polish(b)  # re-evaluate [blink=true], unpolish not needed
+
+    def _accum_menu_construct(self):
+        if self._accum_menu is None:
+            self._accum_menu = AccumMenu(self, self._cmdp)
+        return self._accum_menu
+
+    @QtCore.Slot(object)
     def _on_accum_mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
             self._cmdp.invoke('!Accumulators/reset', None)
             event.accept()
         elif event.button() == QtCore.Qt.RightButton:
-            self._accum_menu = AccumMenu(self, self._cmdp).popup(event.globalPos())
+            menu = self._accum_menu_construct()
+            menu.field_update()
+            menu.popup(event.globalPos())
             event.accept()
 
+    @QtCore.Slot(bool)
     def _on_play_button_toggled(self, checked):
         log.info('control_widget play button %s', checked)
         self._cmdp.publish('Device/#state/play', checked)
 
+    @QtCore.Slot(bool)
     def _on_record_button_toggled(self, checked):
         log.info('control_widget record button %s', checked)
         self._cmdp.publish('Device/#state/record', checked)
 
+    @QtCore.Slot(bool)
     def _on_record_statistics_button_toggled(self, checked):
         log.info('control_widget record statistics button %s', checked)
         self._cmdp.publish('Device/#state/record_statistics', checked)
 
+    @QtCore.Slot(bool)
     def _on_switch_toggled(self, checked):
         log.info('on_off_widget switch %s', checked)
         value = self._current_range_when_on if checked else 'off'
         self._cmdp.publish('Device/setting/i_range', value)
 
     def _populate_combobox(self, combobox, topic):
-        try:
-            combobox.currentIndexChanged.disconnect()
-        except Exception:
-            pass
-        combobox.clear()
-        for option in self._cmdp.preferences.definition_options(topic):
-            combobox.addItem(option)
-        combobox.currentIndexChanged.connect(lambda *args: self._cmdp.publish(topic, str(combobox.currentText())))
+        comboBoxConfig(combobox, self._cmdp.preferences.definition_options(topic))
+        combobox.setProperty('topic', topic)
+        combobox.currentIndexChanged.connect(self._on_combobox_changed)
+
+    @QtCore.Slot(int)
+    def _on_combobox_changed(self, index):
+        combobox = self.sender()
+        self._cmdp.publish(combobox.property('topic'), str(combobox.currentText()))
 
     def _update_combobox(self, combobox, value):
-        index = None
-        for i in range(combobox.count()):
-            if value == str(combobox.itemText(i)):
-                index = i
-                block_signals_state = combobox.blockSignals(True)
-                combobox.setCurrentIndex(index)
-                combobox.blockSignals(block_signals_state)
-                break
-        if index is None:
+        if comboBoxSelectItemByText(combobox, value, block=True) < 0:
             log.warning('Could not find item %s in combobox', value)
 
     def _on_device_parameter(self, topic, data):
         if topic == 'Device/setting/i_range':
             self._update_combobox(self._iRangeComboBox, data)
-            block_state = self._switch.blockSignals(True)
-            if data == 'off':
-                self._switch.setChecked(False)
-            else:
-                self._switch.setChecked(True)
-                self._current_range_when_on = data
-            self._switch.blockSignals(block_state)
+            with signals_blocked(self._switch):
+                if data == 'off':
+                    self._switch.setChecked(False)
+                else:
+                    self._switch.setChecked(True)
+                    self._current_range_when_on = data
         elif topic == 'Device/setting/v_range':
             self._update_combobox(self._vRangeComboBox, data)
 
@@ -315,8 +359,7 @@ class ControlWidget(QtWidgets.QWidget):
         if self._accum_history is None:
             txt = '0 s'
         else:
-            time_str = self._accum_history['time_str']
-            a = self._accum_history['accumulators']
+            time_str, a = self._accum_history
             v = a[field]
             units = self._cmdp.preferences.get('Units/' + field, default=v['units'])
             v = convert_units(v['value'], v['units'], units)
@@ -330,10 +373,7 @@ class ControlWidget(QtWidgets.QWidget):
                 t = data['time']['accumulator']
                 time_str = self._cmdp.elapsed_time_formatter(t['value'])
                 a = data.get('accumulators', {})
-                self._accum_history = {
-                    'time_str': time_str,
-                    'accumulators': a,
-                }
+                self._accum_history = (time_str, a)
             except Exception:
                 self._accum_history = None
             self.accum_update()
@@ -360,22 +400,16 @@ class ControlWidget(QtWidgets.QWidget):
                 self._switch.setEnabled(False)
                 self._iRangeComboBox.setEnabled(False)
                 self._vRangeComboBox.setEnabled(False)
-        elif self._cmdp['Device/#state/source'] in ['USB', 'Buffer']:
+        elif self._cmdp['Device/#state/source'] in STREAMING_SOURCES:
             if topic == 'Device/#state/play':
-                b = self._playButton.blockSignals(True)
-                self._playButton.setChecked(data)
-                self._playButton.blockSignals(b)
+                _button_checked_set(self._playButton, data)
                 self._recordButton.setEnabled(data)
                 self._recordStatisticsButton.setEnabled(data)
                 self._switch.setEnabled(data)
             elif topic == 'Device/#state/record':
-                b = self._recordButton.blockSignals(True)
-                self._recordButton.setChecked(data)
-                self._recordButton.blockSignals(b)
+                _button_checked_set(self._recordButton, data)
             elif topic == 'Device/#state/record_statistics':
-                b = self._recordStatisticsButton.blockSignals(True)
-                self._recordStatisticsButton.setChecked(data)
-                self._recordStatisticsButton.blockSignals(b)
+                _button_checked_set(self._recordStatisticsButton, data)
 
 
 def widget_register(cmdp):
@@ -29,9 +29,8 @@ class ParametersWidget(QtWidgets.QWidget):
         self._main_layout = QtWidgets.QVBoxLayout(self)
         self._parameters_widget = QtWidgets.QWidget(self)
         self._parameters_layout = QtWidgets.QFormLayout(self._parameters_widget)
-        self._spacer = QtWidgets.QSpacerItem(20, 461, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self._main_layout.addWidget(self._parameters_widget)
-        self._main_layout.addItem(self._spacer)
+        self._main_layout.addStretch(1)
 
         self._parameters = {}
         self._source = None
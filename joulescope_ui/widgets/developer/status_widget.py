@@ -33,9 +33,8 @@ class StatusWidget(QtWidgets.QWidget):
         self._device_status_widget = QtWidgets.QWidget(self)
         self._device_status_layout = QtWidgets.QGridLayout(self._device_status_widget)
 
-        self._spacer = QtWidgets.QSpacerItem(20, 461, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self._main_layout.addWidget(self._device_status_widget)
-        self._main_layout.addItem(self._spacer)
+        self._main_layout.addStretch(1)
 
         self._status = {}
         self._status_row = 0
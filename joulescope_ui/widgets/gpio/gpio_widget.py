@@ -15,11 +15,14 @@
 from PySide2 import QtCore, QtWidgets
 from .gpio_widget_ui import Ui_GpioWidget
 from joulescope_ui.preferences import options_enum, to_bool
-from joulescope_ui.ui_util import comboBoxConfig, comboBoxSelectItemByText
+from joulescope_ui.ui_util import comboBoxConfig, comboBoxSelectItemByText, signals_blocked
 import numpy as np
 
 
 VOLTAGES = ['1.8V', '2.1V', '2.5V', '2.7V', '3.0V', '3.3V', '5.0V']
+_GPO_VALUE = ('0', '1')  # indexed by bool(checked)
+_CURRENT_LSB_VALUE = ('normal', 'gpi0')  # indexed by bool(checked)
+_VOLTAGE_LSB_VALUE = ('normal', 'gpi1')  # indexed by bool(checked)
 
 
 class GpioWidget(QtWidgets.QWidget):
@@ -35,7 +38,6 @@ class GpioWidget(QtWidgets.QWidget):
 
         self._cmdp = cmdp
         self._state = None
-        self._update_active = False
         self._inputs = [('current_lsb', self.ui.input0CheckBox, self.ui.input0Label),
                         ('voltage_lsb', self.ui.input1CheckBox, self.ui.input1Label)]
 
@@ -57,50 +59,59 @@ class GpioWidget(QtWidgets.QWidget):
         self.ui.input0CheckBox.toggled.connect(self._on_input0_button)
         self.ui.input1CheckBox.toggled.connect(self._on_input1_button)
 
+    @QtCore.Slot(int)
     def _on_voltage_combobox(self, index):
         voltage_io = self.ui.voltageComboBox.currentText()
         self._cmdp.publish('Device/extio/io_voltage', voltage_io)
 
+    @QtCore.Slot(bool)
     def _on_output0_button(self, checked):
-        self._cmdp.publish('Device/extio/gpo0', '1' if checked else '0')
+        self._cmdp.publish('Device/extio/gpo0', _GPO_VALUE[bool(checked)])
 
+    @QtCore.Slot(bool)
     def _on_output1_button(self, checked):
-        self._cmdp.publish('Device/extio/gpo1', '1' if checked else '0')
+        self._cmdp.publish('Device/extio/gpo1', _GPO_VALUE[bool(checked)])
 
+    @QtCore.Slot(bool)
     def _on_input0_button(self, checked):
-        self._cmdp.publish('Device/extio/current_lsb', 'gpi0' if checked else 'normal')
+        self._cmdp.publish('Device/extio/current_lsb', _CURRENT_LSB_VALUE[bool(checked)])
 
+    @QtCore.Slot(bool)
     def _on_input1_button(self, checked):
-        self._cmdp.publish('Device/extio/voltage_lsb', 'gpi1' if checked else 'normal')
+        self._cmdp.publish('Device/extio/voltage_lsb', _VOLTAGE_LSB_VALUE[bool(checked)])
 
     def _on_io_voltage(self, topic, data):
-        comboBoxSelectItemByText(self.ui.voltageComboBox, data)
+        comboBoxSelectItemByText(self.ui.voltageComboBox, data, block=True)
 
     def _on_current_lsb(self, topic, data):
-        if data == 'normal':
-            self.ui.input0CheckBox.setChecked(False)
-            self.ui.input0CheckBox.setEnabled(True)
-        elif data == 'gpi0':
-            self.ui.input0CheckBox.setChecked(True)
-            self.ui.input0CheckBox.setEnabled(True)
-        else:
-            self.ui.input0CheckBox.setEnabled(False)
+        with signals_blocked(self.ui.input0CheckBox) as checkbox:
+            if data == 'normal':
+                checkbox.setChecked(False)
+                checkbox.setEnabled(True)
+            elif data == 'gpi0':
+                checkbox.setChecked(True)
+                checkbox.setEnabled(True)
+            else:
+                checkbox.setEnabled(False)
 
     def _on_voltage_lsb(self, topic, data):
-        if data == 'normal':
-            self.ui.input1CheckBox.setChecked(False)
-            self.ui.input1CheckBox.setEnabled(True)
-        elif data == 'gpi1':
-            self.ui.input1CheckBox.setChecked(True)
-            self.ui.input1CheckBox.setEnabled(True)
-        else:
-            self.ui.input1CheckBox.setEnabled(False)
+        with signals_blocked(self.ui.input1CheckBox) as checkbox:
+            if data == 'normal':
+                checkbox.setChecked(False)
+                checkbox.setEnabled(True)
+            elif data == 'gpi1':
+                checkbox.setChecked(True)
+                checkbox.setEnabled(True)
+            else:
+                checkbox.setEnabled(False)
 
     def _on_gpo0(self, topic, data):
-        self.ui.output0Button.setChecked(to_bool(data))
+        with signals_blocked(self.ui.output0Button) as button:
+            button.setChecked(to_bool(data))
 
     def _on_gpo1(self, topic, data):
-        self.ui.output1Button.setChecked(to_bool(data))
+        with signals_blocked(self.ui.output1Button) as button:
+            button.setChecked(to_bool(data))
 
     def _on_device_state_data(self, topic, data):
         if not self.isVisible() or data is None:
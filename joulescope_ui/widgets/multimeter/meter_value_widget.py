@@ -18,6 +18,14 @@ import numpy as np
 import math
 
 
+def _statistic_label(parent, layout, object_name, row, column):
+    label = QtWidgets.QLabel(parent)
+    label.setLineWidth(0)
+    label.setObjectName(object_name)
+    layout.addWidget(label, row, column, 1, 1)
+    return label
+
+
 class MeterValueWidget(QtCore.QObject):
     on_update = QtCore.Signal(object, str)  # [mean, std_dev, min, max, p2p], units : values are formatted strings!
 
@@ -47,45 +55,14 @@ class MeterValueWidget(QtCore.QObject):
         self.unitLabel.setObjectName(f'{name}_unitLabel')
         layout.addWidget(self.unitLabel, row, 1, 4, 1)
 
-        self.stdLabel = QtWidgets.QLabel(parent)
-        self.stdLabel.setLineWidth(0)
-        self.stdLabel.setObjectName(f'{name}_stdLabel')
-        layout.addWidget(self.stdLabel, row, 2, 1, 1)
-
-        self.stdName = QtWidgets.QLabel(parent)
-        self.stdName.setLineWidth(0)
-        self.stdName.setObjectName(f'{name}_stdName')
-        layout.addWidget(self.stdName, row, 3, 1, 1)
-
-        self.minLabel = QtWidgets.QLabel(parent)
-        self.minLabel.setLineWidth(0)
-        self.minLabel.setObjectName(f'{name}_minLabel')
-        layout.addWidget(self.minLabel, row + 1, 2, 1, 1)
-
-        self.minName = QtWidgets.QLabel(parent)
-        self.minName.setLineWidth(0)
-        self.minName.setObjectName(f'{name}_minName')
-        layout.addWidget(self.minName, row + 1, 3, 1, 1)
-
-        self.maxLabel = QtWidgets.QLabel(parent)
-        self.maxLabel.setLineWidth(0)
-        self.maxLabel.setObjectName(f'{name}_maxLabel')
-        layout.addWidget(self.maxLabel, row + 2, 2, 1, 1)
-
-        self.maxName = QtWidgets.QLabel(parent)
-        self.maxName.setLineWidth(0)
-        self.maxName.setObjectName(f'{name}_maxName')
-        layout.addWidget(self.maxName, row + 2, 3, 1, 1)
-
-        self.p2pLabel = QtWidgets.QLabel(parent)
-        self.p2pLabel.setLineWidth(0)
-        self.p2pLabel.setObjectName(f'{name}_p2pLabel')
-        layout.addWidget(self.p2pLabel, row + 3, 2, 1, 1)
-
-        self.p2pName = QtWidgets.QLabel(parent)
-        self.p2pName.setLineWidth(0)
-        self.p2pName.setObjectName(f'{name}_p2pName')
-        layout.addWidget(self.p2pName, row + 3, 3, 1, 1)
+        self.stdLabel = _statistic_label(parent, layout, f'{name}_stdLabel', row, 2)
+        self.stdName = _statistic_label(parent, layout, f'{name}_stdName', row, 3)
+        self.minLabel = _statistic_label(parent, layout, f'{name}_minLabel', row + 1, 2)
+        self.minName = _statistic_label(parent, layout, f'{name}_minName', row + 1, 3)
+        self.maxLabel = _statistic_label(parent, layout, f'{name}_maxLabel', row + 2, 2)
+        self.maxName = _statistic_label(parent, layout, f'{name}_maxName', row + 2, 3)
+        self.p2pLabel = _statistic_label(parent, layout, f'{name}_p2pLabel', row + 3, 2)
+        self.p2pName = _statistic_label(parent, layout, f'{name}_p2pName', row + 3, 3)
 
         self.main_widgets = [self.valueLabel, self.unitLabel]
         for w in self.main_widgets:
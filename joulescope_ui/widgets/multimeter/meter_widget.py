@@ -16,6 +16,7 @@ from PySide2 import QtCore, QtGui, QtWidgets
 from joulescope.units import three_sig_figs
 from .meter_value_widget import MeterValueWidget
 from joulescope_ui.ui_util import rgba_to_css
+from joulescope_ui.widgets.accum_label import AccumLabel
 import datetime
 import logging
 log = logging.getLogger(__name__)
@@ -70,11 +71,11 @@ class MeterWidget(QtWidgets.QWidget):
         self.accumulateButton.toggled.connect(self.on_accumulate_toggled)
         self.accumulateButton.setToolTip(ACCUMULATE_TOOLTIP)
 
-        self.accumulateDurationLabel = QtWidgets.QLabel(self)
+        self.accumulateDurationLabel = AccumLabel(self)
+        self.accumulateDurationLabel.mousePressed.connect(self._on_accumulate_duration_mouse_press)
         self.controlLayout.addWidget(self.accumulateDurationLabel)
 
-        self.controlSpacer = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.controlLayout.addItem(self.controlSpacer)
+        self.controlLayout.addStretch(1)
 
         self._grid_widget = QtWidgets.QWidget(self)
         self.verticalLayout.addWidget(self._grid_widget)
@@ -99,6 +100,9 @@ class MeterWidget(QtWidgets.QWidget):
             w.configure(name.capitalize(), units_short, units_long)
             self.values[name] = w
         self.values['energy'].configure_energy()
+        # bound update methods, resolved once for the statistics hot path
+        self._update_value_fns = {name: w.update_value for name, w in self.values.items()}
+        self._update_energy = self.values['energy'].update_energy
 
         self._grid_layout.setColumnStretch(0, 1)
         self._grid_layout.setColumnStretch(1, 1)
@@ -142,7 +146,7 @@ class MeterWidget(QtWidgets.QWidget):
         self.values['power'].accumulate_enable = checked
 
     def _on_accumulator_reset(self, topic, statistics):
-        self.values['energy'].update_energy(0, 0, 0)
+        self._update_energy(0, 0, 0)
 
     def _on_device_statistics(self, topic, statistics):
         """Update the multimeter display
@@ -160,16 +164,17 @@ class MeterWidget(QtWidgets.QWidget):
         else:
             self._accumulate_duration = statistics['time']['delta']['value']
             accum_txt = three_sig_figs(self._accumulate_duration, 's')
+        update_value_fns = self._update_value_fns
         for name, field in statistics['signals'].items():
-            if name not in self.values:
-                continue
-            self.values[name].update_value(field)
+            fn = update_value_fns.get(name)
+            if fn is not None:
+                fn(field)
         accum_time = statistics['time']['accumulator']
-        energy = statistics['accumulators']['energy']['value']
-        charge = statistics['accumulators']['charge']['value']
-        self.values['energy'].update_energy(accum_time['value'], energy, charge)
+        accumulators = statistics['accumulators']
+        energy = accumulators['energy']['value']
+        charge = accumulators['charge']['value']
+        self._update_energy(accum_time['value'], energy, charge)
         self.accumulateDurationLabel.setText(accum_txt)
-        self.accumulateDurationLabel.mousePressEvent = self._on_accumulate_duration_mouse_press
 
     def _on_accumulate_duration_mouse_press(self, event: QtGui.QMouseEvent):
         # if event.button() == QtCore.Qt.LeftButton:
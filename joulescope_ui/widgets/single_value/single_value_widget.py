@@ -16,7 +16,7 @@ from PySide2 import QtCore, QtGui, QtWidgets
 import math
 from joulescope.units import unit_prefix
 from joulescope_ui.units import convert_units
-from joulescope_ui.ui_util import rgba_to_css, comboBoxSelectItemByText
+from joulescope_ui.ui_util import rgba_to_css, comboBoxSelectItemByText, signals_blocked
 import logging
 log = logging.getLogger(__name__)
 
@@ -40,6 +40,9 @@ class SingleValueWidget(QtWidgets.QWidget):
         self._cmdp = cmdp
         self._font_index = 2
         self._statistics = {}
+        self._selection_key = None  # (field index, statistic index)
+        self._min_widths = None  # (value, unit) label minimum widths
+        self._selection = (None, None)  # (field, statistic)
         self._state_preference = state_preference
         self.setObjectName("SingleValueWidget")
         self.resize(387, 76)
@@ -63,8 +66,7 @@ class SingleValueWidget(QtWidgets.QWidget):
         self.statisticComboBox.setObjectName("statisticComboBox")
         self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.statisticComboBox)
         self.horizontalLayout.addWidget(self.widget)
-        self.spacerItem = QtWidgets.QSpacerItem(44, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout.addItem(self.spacerItem)
+        self.horizontalLayout.addStretch(1)
 
         self.value_widget = QtWidgets.QWidget(self)
         self.value_widget.setObjectName("ValueWidget")
@@ -103,7 +105,6 @@ class SingleValueWidget(QtWidgets.QWidget):
         ]
         for topic, fn, update_now in self._subscribe:
             cmdp.subscribe(topic, fn, update_now=update_now)
-        self.retranslateUi()
 
     def closeEvent(self, event):
         for topic, fn, update_now in self._subscribe:
@@ -150,6 +151,11 @@ class SingleValueWidget(QtWidgets.QWidget):
     @QtCore.Slot(object, str)
     def _on_device_statistics(self, topic, statistics):
         self._statistics = statistics
+        if self.isVisible():  # otherwise defer to showEvent
+            self._update()
+
+    def showEvent(self, event):
+        QtWidgets.QWidget.showEvent(self, event)
         self._update()
 
     def _update(self):
@@ -158,22 +164,23 @@ class SingleValueWidget(QtWidgets.QWidget):
         if self.fieldComboBox.count() == 0:
             fields = list(self._statistics['signals'].keys()) + \
                      list(self._statistics['accumulators'].keys())
-            block_signals_state = self.fieldComboBox.blockSignals(True)
-            for field in fields:
-                self.fieldComboBox.addItem(field)
-            self._on_state(None, None)  # restore
-            self.fieldComboBox.blockSignals(block_signals_state)
-        field = self.fieldComboBox.currentText()
+            with signals_blocked(self.fieldComboBox):
+                self.fieldComboBox.addItems(fields)
+                self._on_state(None, None)  # restore
+        key = (self.fieldComboBox.currentIndex(), self.statisticComboBox.currentIndex())
+        if key != self._selection_key:
+            field = self.fieldComboBox.currentText()
+            stat = STATISTICS_TRANSLATE.get(self.statisticComboBox.currentText())
+            self.statisticComboBox.setEnabled(field in self._statistics['signals'])
+            self._selection_key = key
+            self._selection = (field, stat)
+        field, stat = self._selection
         if field in self._statistics['signals']:
-            self.statisticComboBox.setEnabled(True)
-            stat_user = self.statisticComboBox.currentText()
-            stat = STATISTICS_TRANSLATE[stat_user]
             value = self._statistics['signals'][field][stat]['value']
             units = self._statistics['signals'][field][stat]['units']
             if stat == 'σ2':
                 value = math.sqrt(value)
         elif field in self._statistics['accumulators']:
-            self.statisticComboBox.setEnabled(False)
             value = self._statistics['accumulators'][field]['value']
             units = self._statistics['accumulators'][field]['units']
         else:
@@ -202,21 +209,20 @@ class SingleValueWidget(QtWidgets.QWidget):
         _translate = QtCore.QCoreApplication.translate
         self.fieldLabel.setText(_translate("Form", "Field"))
         self.statisticLabel.setText(_translate("Form", "Statistic"))
-        self.statisticComboBox.addItem(_translate("Form", "Mean"))
-        self.statisticComboBox.addItem(_translate("Form", "Standard Deviation"))
-        self.statisticComboBox.addItem(_translate("Form", "Minimum"))
-        self.statisticComboBox.addItem(_translate("Form", "Maximum"))
-        self.statisticComboBox.addItem(_translate("Form", "Peak-to-Peak"))
+        self.statisticComboBox.addItems([_translate("Form", name) for name in STATISTICS_TRANSLATE])
         self.valueLabel.setText("")
         self.unitLabel.setText(_translate("Form", ""))
 
     def resizeEvent(self, event):
         if event is not None:
             super().resizeEvent(event)
-        width = self.valueLabel.fontMetrics().boundingRect("i+0.00000").width()
-        self.valueLabel.setMinimumWidth(width)
-        width = self.unitLabel.fontMetrics().boundingRect("imW").width()
-        self.unitLabel.setMinimumWidth(width)
+        min_widths = (self.valueLabel.fontMetrics().boundingRect("i+0.00000").width(),
+                      self.unitLabel.fontMetrics().boundingRect("imW").width())
+        if min_widths != self._min_widths:
+            # only changes with the font, avoid relayout on every resize
+            self._min_widths = min_widths
+            self.valueLabel.setMinimumWidth(min_widths[0])
+            self.unitLabel.setMinimumWidth(min_widths[1])
 
 
 def widget_register(cmdp):
@@ -2,7 +2,7 @@
 # Thank you to Stefan Scherfke and IMAN4K
 # https://stackoverflow.com/a/51825815/888653
 
-from PySide2.QtCore import QPropertyAnimation, QRectF, QSize, Qt, Property
+from PySide2.QtCore import QEvent, QPropertyAnimation, QRectF, QSize, Qt, Property
 from PySide2.QtGui import QPainter
 from PySide2.QtWidgets import (
     QAbstractButton,
@@ -29,6 +29,8 @@ class Switch(QAbstractButton):
             False: lambda: self._base_offset,
         }
         self._offset = self._base_offset
+        self._disabled_colors = None  # (track_brush, thumb_brush, text_color), cleared on palette change
+        self._thumb_font = None  # cleared on font change
 
         palette = self.palette()
         if self._thumb_radius > self._track_radius:
@@ -87,6 +89,19 @@ class Switch(QAbstractButton):
         super().setChecked(checked)
         self.offset = self._end_offset[checked]()
 
+    def _disabled_colors_get(self):
+        if self._disabled_colors is None:
+            palette = self.palette()
+            self._disabled_colors = (palette.shadow(), palette.mid(), palette.shadow().color())
+        return self._disabled_colors
+
+    def changeEvent(self, event):  # pylint: disable=invalid-name
+        if event.type() == QEvent.PaletteChange:
+            self._disabled_colors = None
+        elif event.type() == QEvent.FontChange:
+            self._thumb_font = None
+        super().changeEvent(event)
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.offset = self._end_offset[self.isChecked()]()
@@ -98,15 +113,14 @@ class Switch(QAbstractButton):
         track_opacity = self._track_opacity
         thumb_opacity = 1.0
         text_opacity = 1.0
+        checked = self.isChecked()
         if self.isEnabled():
-            track_brush = self._track_color[self.isChecked()]
-            thumb_brush = self._thumb_color[self.isChecked()]
-            text_color = self._text_color[self.isChecked()]
+            track_brush = self._track_color[checked]
+            thumb_brush = self._thumb_color[checked]
+            text_color = self._text_color[checked]
         else:
             track_opacity *= 0.8
-            track_brush = self.palette().shadow()
-            thumb_brush = self.palette().mid()
-            text_color = self.palette().shadow().color()
+            track_brush, thumb_brush, text_color = self._disabled_colors_get()
 
         p.setBrush(track_brush)
         p.setOpacity(track_opacity)
@@ -128,8 +142,11 @@ class Switch(QAbstractButton):
         )
         p.setPen(text_color)
         p.setOpacity(text_opacity)
-        font = p.font()
-        font.setPixelSize(1.5 * self._thumb_radius)
+        font = self._thumb_font
+        if font is None:
+            font = p.font()
+            font.setPixelSize(1.5 * self._thumb_radius)
+            self._thumb_font = font
         p.setFont(font)
         p.drawText(
             QRectF(
@@ -139,7 +156,7 @@ class Switch(QAbstractButton):
                 2 * self._thumb_radius,
             ),
             Qt.AlignCenter,
-            self._thumb_text[self.isChecked()],
+            self._thumb_text[checked],
         )
 
     def mouseReleaseEvent(self, event):  # pylint: disable=invalid-name
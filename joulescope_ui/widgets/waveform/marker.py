@@ -55,13 +55,16 @@ class Marker(pg.GraphicsObject):
         self.moving_offset = 0.0
         self.start_pos = 0.0
         self._marker_time_text = pg.TextItem("")
-        self._delta_time_text = pg.TextItem("")
-        self._delta_time_text.setAnchor([0.5, 0])
-        self._delta_time_text.setVisible(False)
-        self.graphic_items = [self._marker_time_text, self._delta_time_text]
+        self._delta_time_text = None  # constructed on demand, left dual marker only
+        self.graphic_items = [self._marker_time_text]
         self.text = {}  #: Dict[str, List[weakref.ReferenceType[Signal], TextItem]]
 
         self._instance_prefix = f'Widgets/Waveform/Markers/_state/instances/{name}/'
+        # instance topics, formatted once rather than on every access
+        self._topic_pos = self._instance_prefix + 'pos'
+        self._topic_color = self._instance_prefix + 'color'
+        self._topic_shape = self._instance_prefix + 'shape'
+        self._topic_statistics = self._instance_prefix + 'statistics'
         for key, value in state.items():
             self._cmdp.preferences.set(self._instance_prefix + key, value)
         self.set_pos(state.get('pos'))
@@ -71,13 +74,11 @@ class Marker(pg.GraphicsObject):
 
     @property
     def statistics_show(self):
-        p = self._instance_prefix + 'statistics'
-        return self._cmdp.preferences.get(p, default='right')
+        return self._cmdp.preferences.get(self._topic_statistics, default='right')
 
     @statistics_show.setter
     def statistics_show(self, value):
-        p = self._instance_prefix + 'statistics'
-        return self._cmdp.publish(p, value)
+        return self._cmdp.publish(self._topic_statistics, value)
 
     def remove(self):
         state = {'name': self._name}
@@ -111,11 +112,20 @@ class Marker(pg.GraphicsObject):
         self._pair = value
         if self.is_left:
             self._marker_time_text.setAnchor([1, 0])
-            self._delta_time_text.setVisible(True)
+            self._delta_time_text_construct().setVisible(True)
         else:
             self._marker_time_text.setAnchor([0, 0])
         self._redraw()
 
+    def _delta_time_text_construct(self):
+        if self._delta_time_text is None:
+            item = pg.TextItem("")
+            item.setAnchor([0.5, 0])
+            item.setParentItem(self.parentItem())
+            self._delta_time_text = item
+            self.graphic_items.append(item)
+        return self._delta_time_text
+
     def _endpoints(self):
         """Get the endpoints in the scene's (parent) coordinates.
 
@@ -145,7 +155,7 @@ class Marker(pg.GraphicsObject):
             return 0, 0, 0
         h = axis.geometry().height()
         he = h // 3
-        shape = self._cmdp[self._instance_prefix + 'shape']
+        shape = self._cmdp[self._topic_shape]
         if shape in [None, 'none']:
             return 0, 0, he, h
         if shape in ['right']:
@@ -179,7 +189,7 @@ class Marker(pg.GraphicsObject):
         wl, wr, he, h = self._flag_bounds_relative()
         if not h:
             return
-        color = self._cmdp[self._instance_prefix + 'color']
+        color = self._cmdp[self._topic_color]
         brush = pg.mkBrush(color)
         painter.setBrush(brush)
         painter.setPen(QtCore.Qt.NoPen)
@@ -205,7 +215,7 @@ class Marker(pg.GraphicsObject):
         axis = self._axis()
         if axis is None or axis.linkedView() is None:
             return
-        color = self._cmdp[self._instance_prefix + 'color']
+        color = self._cmdp[self._topic_color]
         if self.picture is None:
             try:
                 p.resetTransform()
@@ -252,7 +262,7 @@ class Marker(pg.GraphicsObject):
             return
         self._x = x
         self._axis().marker_moving_emit(self.name, x)
-        self._cmdp.publish(self._instance_prefix + 'pos', x, no_undo=True)
+        self._cmdp.publish(self._topic_pos, x, no_undo=True)
         self._redraw()
 
     def _time_style(self):
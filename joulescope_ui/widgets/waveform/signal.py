@@ -61,6 +61,8 @@ class Signal(QtCore.QObject):
                 'scale': 'linear',
             },
         }
+        self._y_log_min = None  # y-axis log_min when logarithmic, resolved on config change
+        self._integration_units = INTEGRATION_UNITS.get(units)
         self._annotations: List[text_annotation.TextAnnotation] = []
         self._statistics_font_resizer = statistics_font_resizer
         self.markers: Dict[str, Marker] = None   # WARNING: for reference only
@@ -113,8 +115,7 @@ class Signal(QtCore.QObject):
 
         cmdp.subscribe('Widgets/Waveform/grid_y', self._on_grid_y, update_now=True)
         cmdp.subscribe('Widgets/Waveform/show_min_max', self._on_show_min_max, update_now=True)
-        cmdp.subscribe('Widgets/Waveform/trace_width', self._on_colors, update_now=True)
-        cmdp.subscribe('Appearance/__index__', self._on_colors, update_now=True)
+        cmdp.subscribe(['Widgets/Waveform/trace_width', 'Appearance/__index__'], self._on_colors, update_now=True)
 
     @property
     def annotations(self) -> List[text_annotation.TextAnnotation]:  # for read only
@@ -190,6 +191,7 @@ class Signal(QtCore.QObject):
     def y_axis_config_update(self, cfg):
         scale_orig = self.config['y-axis']['scale']
         self.config['y-axis'].update(**cfg)
+        self._y_log_min_update()
         auto_range = self.config['y-axis']['range'] == 'auto'
         if self.config['y-axis']['scale'] != scale_orig:
             auto_range = True
@@ -258,9 +260,10 @@ class Signal(QtCore.QObject):
             v_min = vb_min
         if not math.isfinite(v_max):
             v_max = vb_max
-        if self.config['y-axis']['scale'] == 'logarithmic':
-            v_min = math.log10(max(v_min, self.config['y-axis']['log_min']))
-            v_max = math.log10(max(v_max, self.config['y-axis']['log_min']))
+        y_log_min = self._y_log_min
+        if y_log_min is not None:
+            v_min = math.log10(max(v_min, y_log_min))
+            v_max = math.log10(max(v_max, y_log_min))
         vb_range = vb_max - vb_min
         v_range = v_max - v_min
 
@@ -316,16 +319,24 @@ class Signal(QtCore.QObject):
             self.curve_range.hide()
 
     def _min_max_enable(self):
+        if self._is_min_max_active:
+            return  # already shown, avoid per-frame visibility churn
         self._is_min_max_active = True
         self._min_max_show()
 
     def _min_max_disable(self):
+        if not self._is_min_max_active:
+            return  # already hidden
         self._is_min_max_active = False
         self._min_max_hide()
 
+    def _y_log_min_update(self):
+        y_axis = self.config['y-axis']
+        self._y_log_min = y_axis['log_min'] if y_axis['scale'] == 'logarithmic' else None
+
     def _log_bound(self, y):
-        if self.config['y-axis']['scale'] == 'logarithmic':
-            y_log_min = self.config['y-axis']['log_min']
+        y_log_min = self._y_log_min
+        if y_log_min is not None:
             y = np.copy(y)
             y[y < y_log_min] = y_log_min
             # y = np.log10(y)
@@ -404,7 +415,7 @@ class Signal(QtCore.QObject):
             self.log.warning('signal.update(%r, %r)' % (v_min, v_max))
         if self.text_item is not None:
             labels = single_stat_to_api(v_mean, v_var, v_min, v_max, self.units)
-            integration_units = INTEGRATION_UNITS.get(self.units)
+            integration_units = self._integration_units
             if integration_units is not None:
                 labels['∫'] = {'value': v_mean * x_range, 'units': integration_units}
             labels['Δt'] = {'value': x_range, 'units': 's'}
@@ -497,7 +508,7 @@ class Signal(QtCore.QObject):
         z_x, z_mean, z_var, z_min, z_max = self._most_recent_data
         if not z_x[0] <= x <= z_x[-1]:
             return {}
-        idx = np.argmax(z_x >= x)
+        idx = int(np.searchsorted(z_x, x, side='left'))  # z_x is sorted, first z_x >= x
         y_mean = float(z_mean[idx])
         if not np.isfinite(y_mean):
             return {}
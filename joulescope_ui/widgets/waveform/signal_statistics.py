@@ -103,6 +103,7 @@ class SignalStatistics(pg.GraphicsWidget):
         self._label.setVisible(True)
         self._label.document().setUseDesignMetrics(True)
         self._value_cache = None
+        self._html = None
         self._cmdp = cmdp
         labels = single_stat_to_api(-0.000000001, 0.000001, -0.001, 0.001, self._units)
         self.data_update(labels)
@@ -138,14 +139,20 @@ class SignalStatistics(pg.GraphicsWidget):
 
     def data_clear(self):
         self._value_cache = None
-        self._label.setHtml(f'<html><body></body></html>')
+        self._html_set(f'<html><body></body></html>')
+
+    def _html_set(self, html):
+        # setHtml reparses the document and invalidates the label layout
+        if html != self._html:
+            self._html = html
+            self._label.setHtml(html)
 
     def _data_update(self, labels, x):
         font_color = self._cmdp['Appearance/__index__']['colors']['waveform_font_color']
         style = f'color: {font_color};'
         txt_result = si_format(convert(self._field, labels, self._cmdp))
         html = html_format(txt_result, x=x, style=style)
-        self._label.setHtml(html)
+        self._html_set(html)
 
     def data_update(self, labels, x=None):
         self._value_cache = (labels, x)
@@ -159,6 +166,7 @@ class SignalMarkerStatistics(pg.TextItem):
         self._field = field
         self._cmdp = cmdp
         self._value_cache = None
+        self._html = None
         cmdp.subscribe('Widgets/Waveform/Statistics/font', self._on_font, update_now=True)
         cmdp.subscribe('Appearance/__index__', self._on_font_color, update_now=True)
 
@@ -179,7 +187,12 @@ class SignalMarkerStatistics(pg.TextItem):
             self.data_update(None, *self._value_cache)
 
     def computing(self):
-        self.setHtml(f'<html><body></body></html>')
+        self._html_set(f'<html><body></body></html>')
+
+    def _html_set(self, html):
+        if html != self._html:
+            self._html = html
+            self.setHtml(html)
 
     def move(self, vb, xv=None):
         if vb is not None:
@@ -199,4 +212,4 @@ class SignalMarkerStatistics(pg.TextItem):
             self._value_cache = (xv, labels)
             txt_result = si_format(convert(self._field, labels, self._cmdp))
             html = html_format(txt_result, x=xv, style=style)
-        self.setHtml(html)
+        self._html_set(html)
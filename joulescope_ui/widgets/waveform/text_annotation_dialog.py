@@ -54,8 +54,7 @@ class TextAnnotationDialog(QtWidgets.QDialog):
         self._button_frame.setFrameShadow(QtWidgets.QFrame.Raised)
         self._button_layout = QtWidgets.QHBoxLayout(self._button_frame)
         self._button_layout.setObjectName('button_layout')
-        self._button_spacer = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self._button_layout.addItem(self._button_spacer)
+        self._button_layout.addStretch(1)
 
         self.okButton = QtWidgets.QPushButton(self._button_frame)
         self.okButton.setObjectName('okButton')
@@ -29,6 +29,8 @@ from joulescope_ui.preferences_def import FONT_SIZES
 from pyjls import Writer, DataType, AnnotationType, SignalType, SourceDef, SignalDef, SummaryFSR
 import pyqtgraph as pg
 import pyqtgraph.exporters
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict
 import copy
 import os
@@ -37,6 +39,23 @@ import logging
 
 log = logging.getLogger(__name__)
 SIGNAL_OFFSET_ROW = 2
+ANNOTATION_SAMPLE_RATE = 1000000
+
+
+@dataclass(frozen=True)
+class AnnotationSignalDef:
+    """The JLS signal definition used when saving annotations."""
+    signal_id: int
+    source_id: int
+    sample_rate: int
+    units: str
+
+
+ANNOTATION_SIGNAL_DEFS = {
+    'current': AnnotationSignalDef(1, 1, ANNOTATION_SAMPLE_RATE, 'A'),
+    'voltage': AnnotationSignalDef(2, 1, ANNOTATION_SAMPLE_RATE, 'V'),
+    'power': AnnotationSignalDef(3, 1, ANNOTATION_SAMPLE_RATE, 'W'),
+}
 
 
 class WaveformWidget(QtWidgets.QWidget):
@@ -49,6 +68,7 @@ class WaveformWidget(QtWidgets.QWidget):
         QtWidgets.QWidget.__init__(self, parent=parent)
         self._cmdp = cmdp
         self._x_limits = [0.0, 30.0]
+        self._device_state_source = None  # mirror of Device/#state/source
         self._mouse_pos = None
         self._context_menu_event = None
         self._clipboard_image = None
@@ -65,7 +85,12 @@ class WaveformWidget(QtWidgets.QWidget):
         self.layout.addWidget(self.win)
 
         self._signals_def = {}
+        self._signals_def_list = None  # cached list(self._signals_def.values())
         self._signals: Dict[str, Signal] = {}
+        self._markers_dual_update_timer = QtCore.QTimer(self)  # coalesce dual marker updates
+        self._markers_dual_update_timer.setSingleShot(True)
+        self._markers_dual_update_timer.setInterval(0)
+        self._markers_dual_update_timer.timeout.connect(self._on_markers_dual_update_timer)
         self.config = {
             'show_min_max': True,
             'grid_x': 128,
@@ -288,7 +313,7 @@ class WaveformWidget(QtWidgets.QWidget):
         annotation_clear = anno_text.addAction('&Clear all')
         annotation_clear.triggered.connect(self._on_annotation_text_clear)
 
-        if self._cmdp['Device/#state/source'] == 'File':
+        if self._device_state_source == 'File':
             save_all = annotations.addAction('&Save all')
             save_all.triggered.connect(self._on_annotation_save)
 
@@ -495,23 +520,19 @@ class WaveformWidget(QtWidgets.QWidget):
             fname = os.path.abspath(fname)[:-4] + '.anno.jls'
         else:
             fname, x_start, x_end = value
-        fs = 1000000
-        signal_def = {
-            # signal_id, source_id, sample_rate, units
-            'current': [1, 1, fs, 'A'],
-            'voltage': [2, 1, fs, 'V'],
-            'power':   [3, 1, fs, 'W'],
-        }
+        fs = ANNOTATION_SAMPLE_RATE
+        signal_defs = ANNOTATION_SIGNAL_DEFS
 
         with Writer(fname) as w:
             w.source_def(source_id=1, name='annotations', vendor='-', model='-',
                          version='-', serial_number='-')
-            for name, [signal_id, source_id, sample_rate, units] in signal_def.items():
-                w.signal_def(signal_id=signal_id, source_id=source_id, sample_rate=sample_rate, name=name, units=units)
+            for name, d in signal_defs.items():
+                w.signal_def(signal_id=d.signal_id, source_id=d.source_id, sample_rate=d.sample_rate,
+                             name=name, units=d.units)
 
             # Horizontal markers first, since x-axis position is 0
             for sname, s in self._signals.items():
-                signal_id = signal_def[sname][0]
+                signal_id = signal_defs[sname].signal_id
                 for name, m in s.y_axis.markers.items():
                     w.annotation(signal_id, 0, m.y, AnnotationType.HMARKER, 0, name)
 
@@ -525,7 +546,7 @@ class WaveformWidget(QtWidgets.QWidget):
                 w.annotation(1, x, None, AnnotationType.VMARKER, 0, name)
 
             for sname, s in self._signals.items():
-                signal_id, _, sample_rate, _ = signal_def[sname]
+                signal_id = signal_defs[sname].signal_id
                 for a in s.annotations:
                     x = a.x_pos
                     if (x_start is not None and x <= x_start) or (x_end is not None and x >= x_end):
@@ -565,6 +586,7 @@ class WaveformWidget(QtWidgets.QWidget):
             self.set_display_mode('buffer')
 
     def _on_device_state_source(self, topic, value):
+        self._device_state_source = value
         if value == 'USB':
             if self.set_display_mode('realtime'):
                 self.request_x_change()
@@ -626,9 +648,18 @@ class WaveformWidget(QtWidgets.QWidget):
         if signals is None:
             signals = signal_def
         for signal in signals:
-            signal = copy.deepcopy(signal)
+            if isinstance(signal, MappingProxyType):
+                signal = dict(signal)  # read-only defaults with immutable values
+            else:
+                signal = copy.deepcopy(signal)
             signal['display_name'] = signal.get('display_name', signal['name'])
             self._signals_def[signal['name']] = signal
+        self._signals_def_list = None
+
+    def _signals_def_list_get(self):
+        if self._signals_def_list is None:
+            self._signals_def_list = list(self._signals_def.values())
+        return self._signals_def_list
 
     def _on_signalAdd(self, name):
         signal = self._signals_def[name]
@@ -680,22 +711,25 @@ class WaveformWidget(QtWidgets.QWidget):
                     p.vb.setXLink(None)
                 else:
                     p.vb.setXLink(vb)
-        self._settings_widget.on_signalsAvailable(list(self._signals_def.values()),
+        self._settings_widget.on_signalsAvailable(self._signals_def_list_get(),
                                                   visible=list(self._signals.keys()))
 
+    def _values_column_items(self):
+        # Only signal rows populate the values column (col 2), and each
+        # signal already holds its item, so skip the per-row layout queries.
+        for s in self._signals.values():
+            if s.text_item is not None:
+                yield s.text_item
+
     def values_column_hide(self):
-        for idx in range(self.win.ci.layout.rowCount()):
-            item = self.win.ci.layout.itemAt(idx, 2)
-            if item is not None:
-                item.hide()
-                item.setMaximumWidth(0)
+        for item in self._values_column_items():
+            item.hide()
+            item.setMaximumWidth(0)
 
     def values_column_show(self):
-        for idx in range(self.win.ci.layout.rowCount()):
-            item = self.win.ci.layout.itemAt(idx, 2)
-            if item is not None:
-                item.show()
-                item.setMaximumWidth(16777215)
+        for item in self._values_column_items():
+            item.show()
+            item.setMaximumWidth(16777215)
 
     def _on_data(self, topic, data):
         if not self.isVisible():
@@ -782,7 +816,17 @@ class WaveformWidget(QtWidgets.QWidget):
         elif marker.is_single:
             self._markers_single_update(marker_name)
         else:
-            self._markers_dual_update_all()  # todo : just update one
+            self._markers_dual_update_request()  # todo : just update one
+
+    def _markers_dual_update_request(self):
+        # Each dual marker change publishes several instance topics, so
+        # coalesce them into a single range statistics request.
+        if not self._markers_dual_update_timer.isActive():
+            self._markers_dual_update_timer.start()
+
+    @QtCore.Slot()
+    def _on_markers_dual_update_timer(self):
+        self._markers_dual_update_all()
 
     @QtCore.Slot(str, float)
     def _on_marker_moving(self, marker_name, marker_pos):
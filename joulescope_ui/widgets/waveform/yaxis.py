@@ -57,6 +57,17 @@ class YAxisMenu(QtWidgets.QMenu):
         self.range_group.addAction(self.range_manual)
         self.addMenu(self.range)
 
+        self.scale = None
+        self.scale_linear = None
+        self.scale_logarithmic = None
+        if log_enable:
+            self._scale_construct()
+
+        self.hide_request = QtWidgets.QAction('&Hide', self)
+        self.hide_request.setToolTip('Hide this signal.')
+        self.addAction(self.hide_request)
+
+    def _scale_construct(self):
         self.scale = QtWidgets.QMenu()
         self.scale.setTitle('Scale')
         self.scale_group = QtWidgets.QActionGroup(self)
@@ -78,12 +89,7 @@ class YAxisMenu(QtWidgets.QMenu):
         )
         self.scale.addAction(self.scale_logarithmic)
         self.scale_group.addAction(self.scale_logarithmic)
-        if log_enable:
-            self.addMenu(self.scale)
-
-        self.hide_request = QtWidgets.QAction('&Hide', self)
-        self.hide_request.setToolTip('Hide this signal.')
-        self.addAction(self.hide_request)
+        self.addMenu(self.scale)
 
     def range_set(self, value):
         if value == 'manual':
@@ -94,6 +100,8 @@ class YAxisMenu(QtWidgets.QMenu):
             self.range_manual.setChecked(False)
 
     def scale_set(self, value):
+        if self.scale is None:
+            return
         if value == 'logarithmic':
             self.scale_linear.setChecked(False)
             self.scale_logarithmic.setChecked(True)
@@ -143,11 +151,15 @@ class YAxis(AxisItemPatch):
         self.markers: Dict[str, YMarker] = {}  #  Dict[str, YMarker]
         self._proxy = None
         self._popup_menu_pos = None
+        self._menu = None  # constructed on first use, then reused
 
     def _on_hide(self):
         self._cmdp.publish('!Widgets/Waveform/Signals/remove', self._name)
 
     def _config_update(self, **kwargs):
+        config = self.config
+        if all(config.get(key) == value for key, value in kwargs.items()):
+            return  # no change, skip the signal reconfigure and refresh
         log.info('config update: %s', str(kwargs))
         self.config.update(**kwargs)
         self.sigConfigEvent.emit(self.config.copy())
@@ -155,18 +167,25 @@ class YAxis(AxisItemPatch):
     def range_set(self, value):
         self.config['range'] = value
 
-    def _context_menu(self, pos):
+    def _menu_construct(self):
         menu = YAxisMenu(log_enable=self.config['log_enable'])
-        menu.range_set(self.config['range'])
-        menu.scale_set(self.config['scale'])
         menu.single_marker.triggered.connect(self._on_single_marker)
         menu.dual_markers.triggered.connect(self._on_dual_markers)
         menu.clear_annotations.triggered.connect(self._on_clear_annotations)
         menu.range_auto.triggered.connect(lambda: self._config_update(range='auto'))
         menu.range_manual.triggered.connect(lambda: self._config_update(range='manual'))
-        menu.scale_linear.triggered.connect(lambda: self._config_update(scale='linear'))
-        menu.scale_logarithmic.triggered.connect(lambda: self._config_update(scale='logarithmic'))
+        if menu.scale is not None:
+            menu.scale_linear.triggered.connect(lambda: self._config_update(scale='linear'))
+            menu.scale_logarithmic.triggered.connect(lambda: self._config_update(scale='logarithmic'))
         menu.hide_request.triggered.connect(self._on_hide)
+        return menu
+
+    def _context_menu(self, pos):
+        if self._menu is None:
+            self._menu = self._menu_construct()
+        menu = self._menu
+        menu.range_set(self.config['range'])
+        menu.scale_set(self.config['scale'])
         menu.exec_(pos)
 
     def _find_first_unused_marker_index(self):
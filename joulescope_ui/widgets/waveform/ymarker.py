@@ -52,6 +52,10 @@ class YMarker(pg.GraphicsObject):
         self.start_pos = 0.0
 
         self._instance_prefix = f'Widgets/Waveform/YMarkers/_state/instances/{view.name}/{name}/'
+        # instance topics, formatted once rather than on every access
+        self._topic_pos = self._instance_prefix + 'pos'
+        self._topic_color = self._instance_prefix + 'color'
+        self._topic_statistics = self._instance_prefix + 'statistics'
         for key, value in state.items():
             self._cmdp.preferences.set(self._instance_prefix + key, value)
         self.set_pos(state.get('pos'))
@@ -120,7 +124,7 @@ class YMarker(pg.GraphicsObject):
 
     def paint(self, p, opt, widget):
         vb = self._view()
-        color = self._cmdp[self._instance_prefix + 'color']
+        color = self._cmdp[self._topic_color]
         p.resetTransform()
         vb_rect = vb.geometry()
         y = self.scene_pos_y()
@@ -176,7 +180,7 @@ class YMarker(pg.GraphicsObject):
         if y == self._y:
             return
         self._y = y
-        self._cmdp.publish(self._instance_prefix + 'pos', y, no_undo=True)
+        self._cmdp.publish(self._topic_pos, y, no_undo=True)
         self._redraw()
         if self._pair is not None:
             self._pair._redraw()
@@ -272,13 +276,11 @@ class YMarker(pg.GraphicsObject):
 
     @property
     def statistics_show(self):
-        p = self._instance_prefix + 'statistics'
-        return self._cmdp.preferences.get(p, default='top')
+        return self._cmdp.preferences.get(self._topic_statistics, default='top')
 
     @statistics_show.setter
     def statistics_show(self, value):
-        p = self._instance_prefix + 'statistics'
-        return self._cmdp.publish(p, value)
+        return self._cmdp.publish(self._topic_statistics, value)
 
     def _remove(self, *args, **kwargs):
         cmd = [[self._view().name, self.name]]
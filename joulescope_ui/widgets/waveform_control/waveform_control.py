@@ -14,6 +14,7 @@
 
 from PySide2 import QtCore, QtGui, QtWidgets
 from joulescope_ui.preferences_ui import widget_factory
+from joulescope_ui.ui_util import signals_blocked
 from joulescope_ui.widgets.waveform.signal_def import signal_def
 import sys
 import logging
@@ -81,6 +82,12 @@ TOOLTIP_SIGNAL = """<html><body>
 """
 
 
+TOOLTIP_SIGNALS = {s['name']: TOOLTIP_SIGNAL.format(name=s['name']) for s in signal_def}
+
+
+BUTTON_SIZE_POLICY = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+
+
 class WaveformControlWidget(QtWidgets.QWidget):
 
     def __init__(self, parent, cmdp, state_preference):
@@ -91,6 +98,7 @@ class WaveformControlWidget(QtWidgets.QWidget):
         self._layout = QtWidgets.QHBoxLayout(self)
         self._layout.setObjectName("WaveformControlLayout")
         self._layout.setContentsMargins(-1, 1, -1, 1)
+        self._layout.setEnabled(False)  # activate once after adding all widgets
 
         self._markers_label = QtWidgets.QLabel(self)
         self._markers_label.setText('Markers:')
@@ -120,12 +128,13 @@ class WaveformControlWidget(QtWidgets.QWidget):
         self._signals_label.setText('Signals:')
         self._layout.addWidget(self._signals_label)
         self._signals = {}
+        self._signals_active = None  # tuple of most recently applied signal names
         for signal in signal_def:
             self._add_signal(signal)
 
-        self._spacer = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding,
-                                             QtWidgets.QSizePolicy.Minimum)
-        self._layout.addItem(self._spacer)
+        self._layout.addStretch(1)
+        self._layout.setEnabled(True)
+        self._layout.activate()
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
         h = self.minimumSizeHint().height()
         self.setMinimumHeight(h)
@@ -135,7 +144,7 @@ class WaveformControlWidget(QtWidgets.QWidget):
 
     def _add_button(self, label, callback, tooltip):
         button = QtWidgets.QPushButton(self)
-        button.setSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        button.setSizePolicy(BUTTON_SIZE_POLICY)
         button.setText(label)
         button.setToolTip(tooltip)
         self._layout.addWidget(button)
@@ -155,11 +164,14 @@ class WaveformControlWidget(QtWidgets.QWidget):
     def _add_signal(self, signal):
         button = QtWidgets.QPushButton(self)
         button.setCheckable(True)
-        button.setSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        button.setSizePolicy(BUTTON_SIZE_POLICY)
         name = signal['name']
         abbr = signal['abbreviation']
         button.setText(abbr)
-        button.setToolTip(TOOLTIP_SIGNAL.format(name=name))
+        tooltip = TOOLTIP_SIGNALS.get(name)
+        if tooltip is None:
+            tooltip = TOOLTIP_SIGNAL.format(name=name)
+        button.setToolTip(tooltip)
         if sys.platform == 'win32':
             width = button.fontMetrics().boundingRect(abbr).width()
             button.setMinimumWidth(width + 10)
@@ -175,12 +187,16 @@ class WaveformControlWidget(QtWidgets.QWidget):
             self._cmdp.invoke('!Widgets/Waveform/Signals/remove', name)
 
     def _on_signals_active(self, topic, value):
+        signals_active = tuple(value)
+        if signals_active == self._signals_active:
+            return
+        self._signals_active = signals_active
+        active = frozenset(signals_active)
         for name, button in self._signals.items():
-            checked = name in value
+            checked = name in active
             if checked != button.isChecked():
-                block_signals_state = button.blockSignals(True)
-                button.setChecked(checked)
-                button.blockSignals(block_signals_state)
+                with signals_blocked(button):
+                    button.setChecked(checked)
 
     @QtCore.Slot(bool)
     def _on_markers_single_add(self, checked):